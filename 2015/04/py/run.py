@@ -1,17 +1,14 @@
 #! /usr/bin/python3
 
 import sys, os, time
-from hashlib import md5
 from typing import Tuple
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "lib", "py"))
+from md5mining import find_hashes
 
 
 def find_hash(secret_key: str, prefix_count: int, guess: int) -> int:
-    prefix = "0" * prefix_count
-    while True:
-        hash = md5((secret_key + str(guess)).encode("utf-8")).hexdigest()
-        if hash.startswith(prefix):
-            return guess
-        guess += 1
+    index, _ = next(find_hashes(secret_key, prefix_count, guess))
+    return index
 
 
 def solve(secret_key: str) -> Tuple[int,int]:
@@ -3,7 +3,8 @@
 import sys
 import os
 import time
-from typing import Callable, Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
+from array import array
 import re
 
 Instruction = Tuple[int, int, int, int, int]
@@ -16,27 +17,72 @@ ACTIONS = {
 MATRIX_SIDE = 1000
 
 
-def run_matrix(instructions: List[Instruction], update_funcs: Dict[int, Callable[[int], int]]) -> int:
-    matrix = [0] * (MATRIX_SIDE * MATRIX_SIDE)
+def count_lit(instructions: List[Instruction]) -> int:
+    # One int per row, one bit per light
+    rows = [0] * MATRIX_SIDE
     for action, x_start, y_start, x_end, y_end in instructions:
-        update_func = update_funcs[action]
-        for x in range(x_start, x_end + 1):
-            for y in range(y_start, y_end + 1):
-                position = x + y * MATRIX_SIDE
-                matrix[position] = update_func(matrix[position])
-    return sum(matrix)
+        mask = ((1 << (x_end - x_start + 1)) - 1) << x_start
+        for y in range(y_start, y_end + 1):
+            if action == TURN_ON:
+                rows[y] |= mask
+            elif action == TOGGLE:
+                rows[y] ^= mask
+            else:
+                rows[y] &= ~mask
+    return sum(bin(row).count("1") for row in rows)
+
+
+def get_segments(starts: Iterable[int], ends: Iterable[int], compress: bool) -> Tuple[Dict[int, int], List[int]]:
+    # Maps each range bound to its segment index and gives each segment's width
+    if compress:
+        breakpoints = sorted(set(starts) | {end + 1 for end in ends} | {0, MATRIX_SIDE})
+    else:
+        breakpoints = list(range(MATRIX_SIDE + 1))
+    indexes = {breakpoint: index for index, breakpoint in enumerate(breakpoints)}
+    return indexes, [end - start for start, end in zip(breakpoints, breakpoints[1:])]
+
+
+def get_lanes(start: int, end: int, lane_bits: int) -> int:
+    # 1 in the lowest bit of every lane from start to end - 1
+    lane_mask = (1 << lane_bits) - 1
+    return (((1 << ((end - start) * lane_bits)) - 1) // lane_mask) << (start * lane_bits)
+
+
+def total_brightness(instructions: List[Instruction], compress: bool = True) -> int:
+    # One int per row segment, one lane per column segment, all lanes updated at once
+    x_indexes, widths = get_segments((x for _, x, _, _, _ in instructions), (x for _, _, _, x, _ in instructions), compress)
+    y_indexes, heights = get_segments((y for _, _, y, _, _ in instructions), (y for _, _, _, _, y in instructions), compress)
+    lane_bits, typecode = (16, "H") if 2 * len(instructions) < 1 << 15 else (32, "I")
+    low = (1 << (lane_bits - 1)) - 1
+    rows = [0] * len(heights)
+    for action, x_start, y_start, x_end, y_end in instructions:
+        lanes = get_lanes(x_indexes[x_start], x_indexes[x_end + 1], lane_bits)
+        low_lanes = lanes * low
+        high_lanes = lanes << (lane_bits - 1)
+        for y in range(y_indexes[y_start], y_indexes[y_end + 1]):
+            if action == TURN_ON:
+                rows[y] += lanes
+            elif action == TOGGLE:
+                rows[y] += lanes << 1
+            else:
+                # Top bit of a lane is set after adding low only if the lane was not 0
+                rows[y] -= ((rows[y] + low_lanes) & high_lanes) >> (lane_bits - 1)
+    total = 0
+    row_bytes = len(widths) * lane_bits // 8
+    for row, height in zip(rows, heights):
+        # Lane 0 is the lowest one, so it comes first in little endian order
+        values = array(typecode, row.to_bytes(row_bytes, "little"))
+        if sys.byteorder == "big":
+            values.byteswap()
+        total += height * sum(value * width for value, width in zip(values, widths))
+    return total
 
 
 def solve(instructions: List[Instruction]) -> Tuple[int, int]:
-    return (run_matrix(instructions, {
-        TURN_ON: lambda _: 1,
-        TOGGLE: lambda value: not value,
-        TURN_OFF: lambda _: 0
-    }), run_matrix(instructions, {
-        TURN_ON: lambda value: value + 1,
-        TOGGLE: lambda value: value + 2,
-        TURN_OFF: lambda value: value - 1 if value > 0 else 0
-    }))
+    return (
+        count_lit(instructions),
+        total_brightness(instructions)
+    )
 
 
 instruction_regex = re.compile(
@@ -3,7 +3,8 @@
 import sys
 import os
 import time
-from typing import List, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+from collections import defaultdict
 from dataclasses import dataclass
 import re
 
@@ -14,32 +15,82 @@ class Replacement():
     target: str
 
 
-def process_replacement(molecule: str, replacement: Replacement) -> List[str]:
-    return ["".join([molecule[:match.start()], replacement.target, molecule[match.end():]])
-            for match in re.finditer(replacement.source, molecule)]
+HASH_MODULUS = (1 << 61) - 1
+HASH_BASE = 131
+
+element_regex = re.compile(r"[A-Z][a-z]?|e")
+
+
+def tokenize(molecule: str) -> List[str]:
+    return element_regex.findall(molecule)
+
+
+def get_hash(text: str) -> int:
+    value = 0
+    for character in text:
+        value = (value * HASH_BASE + ord(character)) % HASH_MODULUS
+    return value
 
 
 def part1(puzzle_input: Tuple[List[Replacement], str]) -> int:
+    # Each new molecule is prefix + target + suffix, so its hash comes from prefix hashes of the
+    # molecule without building the string
     replacements, molecule = puzzle_input
-    new_molecules: List[str] = []
+    prefix_hashes = [0]
+    powers = [1]
+    for character in molecule:
+        prefix_hashes.append((prefix_hashes[-1] * HASH_BASE + ord(character)) % HASH_MODULUS)
+        powers.append(powers[-1] * HASH_BASE % HASH_MODULUS)
+    sources: Dict[str, List[str]] = defaultdict(list)
     for replacement in replacements:
-        for new_molecule in process_replacement(molecule, replacement):
-            new_molecules.append(new_molecule)
-    return len(set(new_molecules))
+        sources[replacement.source].append(replacement.target)
+    new_molecules: Set[int] = set()
+    start = 0
+    for token in tokenize(molecule):
+        end = start + len(token)
+        suffix_length = len(molecule) - end
+        suffix_hash = (prefix_hashes[-1] - prefix_hashes[end] * powers[suffix_length]) % HASH_MODULUS
+        for target in sources[token]:
+            new_hash = (prefix_hashes[start] * powers[len(target)] + get_hash(target)) % HASH_MODULUS
+            new_molecules.add((new_hash * powers[suffix_length] + suffix_hash) % HASH_MODULUS)
+        start = end
+    return len(new_molecules)
+
+
+def reduce_greedily(replacements: List[Replacement], tokens: List[str]) -> Optional[int]:
+    # Undoes replacements, rightmost first, until only e is left; None if it gets stuck
+    reductions: Dict[str, List[Tuple[List[str], List[str]]]] = defaultdict(list)
+    for replacement in replacements:
+        target = tokenize(replacement.target)
+        reductions[target[0]].append((target, tokenize(replacement.source)))
+    for options in reductions.values():
+        options.sort(key=lambda option: -len(option[0]))
+    longest = max(len(target) for options in reductions.values() for target, _ in options)
+    tokens = list(tokens)
+    count = 0
+    position = len(tokens) - 1
+    while tokens != ["e"]:
+        if position < 0:
+            return None
+        for target, source in reductions[tokens[position]]:
+            if tokens[position:position + len(target)] == target and (source != ["e"] or len(target) == len(tokens)):
+                tokens[position:position + len(target)] = source
+                count += 1
+                position = min(position + longest, len(tokens)) - 1
+                break
+        else:
+            position -= 1
+    return count
 
 
 def part2(puzzle_input: Tuple[List[Replacement], str]) -> int:
     replacements, molecule = puzzle_input
-    target_molecule = "e"
-    molecule = molecule[::-1]
-    replacement_dictionary = {
-        rep.target[::-1]: rep.source[::-1] for rep in replacements}
-    count = 0
-    replacements_regex = re.compile("|".join(replacement_dictionary.keys()))
-    while molecule != target_molecule:
-        molecule = replacements_regex.sub(
-            lambda match: replacement_dictionary[match.group()], molecule, 1)
-        count += 1
+    tokens = tokenize(molecule)
+    count = reduce_greedily(replacements, tokens)
+    if count is None:
+        # Every replacement is X => XX, X => X Rn X Ar, X => X Rn X Y X Ar or X => X Rn X Y X Y X Ar:
+        # each one adds a single element, besides Rn, Ar and every Y with the element after it
+        count = len(tokens) - tokens.count("Rn") - tokens.count("Ar") - 2 * tokens.count("Y") - 1
     return count
 
 
@@ -2,26 +2,26 @@
 
 import sys, os, time
 from typing import Tuple
-from hashlib import md5
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "lib", "py"))
+from md5mining import find_hashes
 
-PREFIX = "0" * 5
+PREFIX_ZEROS = 5
 
 
 def solve(door_id: str) -> Tuple[str,str]:
-    index = 0
     password1 = ""
     password2 = [ "_" for _ in range(8) ]
     missing_indexes = list("01234567")
-    while missing_indexes:
-        result = md5((door_id + str(index)).encode("utf-8")).hexdigest()
-        if result.startswith(PREFIX):
-            if len(password1) < 8:
-                password1 += result[5]
-            digit_index = result[5]
-            if digit_index in missing_indexes:
-                password2[int(digit_index)] = result[6]
-                missing_indexes.remove(digit_index)
-        index += 1
+    for _, digest in find_hashes(door_id, PREFIX_ZEROS):
+        result = digest.hex()
+        if len(password1) < 8:
+            password1 += result[5]
+        digit_index = result[5]
+        if digit_index in missing_indexes:
+            password2[int(digit_index)] = result[6]
+            missing_indexes.remove(digit_index)
+            if not missing_indexes:
+                break
     return (
         password1, 
         "".join(password2)
@@ -3,9 +3,11 @@
 import sys
 import os
 import time
-from typing import Dict, List, Tuple
+from typing import List, Tuple
 from enum import Enum
 from itertools import product
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "lib", "py"))
+from ocr import read_points
 
 
 class InstructionType(Enum):
@@ -17,143 +19,8 @@ class InstructionType(Enum):
 Instruction = Tuple[InstructionType, int, int]
 
 
-CHARACTER_WIDTH = 5
 SCREEN_WIDTH = 50
 SCREEN_HEIGHT = 6
-LETTERS: Dict[int, str] = {
-    (0b01100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b11110 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b10010 << CHARACTER_WIDTH * 5): "A",
-
-    (0b11100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b11100 << CHARACTER_WIDTH * 2) +
-    (0b10010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b11100 << CHARACTER_WIDTH * 5): "B",
-
-    (0b01100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10000 << CHARACTER_WIDTH * 2) +
-    (0b10000 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b01100 << CHARACTER_WIDTH * 5): "C",
-
-    (0b11100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b10010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b11100 << CHARACTER_WIDTH * 5): "D",
-
-    (0b11110 << CHARACTER_WIDTH * 0) +
-    (0b10000 << CHARACTER_WIDTH * 1) +
-    (0b11100 << CHARACTER_WIDTH * 2) +
-    (0b10000 << CHARACTER_WIDTH * 3) +
-    (0b10000 << CHARACTER_WIDTH * 4) +
-    (0b11110 << CHARACTER_WIDTH * 5): "E",
-
-    (0b11110 << CHARACTER_WIDTH * 0) +
-    (0b10000 << CHARACTER_WIDTH * 1) +
-    (0b11100 << CHARACTER_WIDTH * 2) +
-    (0b10000 << CHARACTER_WIDTH * 3) +
-    (0b10000 << CHARACTER_WIDTH * 4) +
-    (0b10000 << CHARACTER_WIDTH * 5): "F",
-
-    (0b01100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10000 << CHARACTER_WIDTH * 2) +
-    (0b10110 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b01110 << CHARACTER_WIDTH * 5): "G",
-
-    (0b10010 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b11110 << CHARACTER_WIDTH * 2) +
-    (0b10010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b10010 << CHARACTER_WIDTH * 5): "H",
-
-    (0b01110 << CHARACTER_WIDTH * 0) +
-    (0b00100 << CHARACTER_WIDTH * 1) +
-    (0b00100 << CHARACTER_WIDTH * 2) +
-    (0b00100 << CHARACTER_WIDTH * 3) +
-    (0b00100 << CHARACTER_WIDTH * 4) +
-    (0b01110 << CHARACTER_WIDTH * 5): "I",
-
-    (0b00110 << CHARACTER_WIDTH * 0) +
-    (0b00010 << CHARACTER_WIDTH * 1) +
-    (0b00010 << CHARACTER_WIDTH * 2) +
-    (0b00010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b01100 << CHARACTER_WIDTH * 5): "J",
-
-    (0b10010 << CHARACTER_WIDTH * 0) +
-    (0b10100 << CHARACTER_WIDTH * 1) +
-    (0b11000 << CHARACTER_WIDTH * 2) +
-    (0b10100 << CHARACTER_WIDTH * 3) +
-    (0b10100 << CHARACTER_WIDTH * 4) +
-    (0b10010 << CHARACTER_WIDTH * 5): "K",
-
-    (0b10000 << CHARACTER_WIDTH * 0) +
-    (0b10000 << CHARACTER_WIDTH * 1) +
-    (0b10000 << CHARACTER_WIDTH * 2) +
-    (0b10000 << CHARACTER_WIDTH * 3) +
-    (0b10000 << CHARACTER_WIDTH * 4) +
-    (0b11110 << CHARACTER_WIDTH * 5): "L",
-
-    (0b01100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b10010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b01100 << CHARACTER_WIDTH * 5): "O",
-
-    (0b11100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b11100 << CHARACTER_WIDTH * 3) +
-    (0b10000 << CHARACTER_WIDTH * 4) +
-    (0b10000 << CHARACTER_WIDTH * 5): "P",
-
-    (0b11100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b11100 << CHARACTER_WIDTH * 3) +
-    (0b10100 << CHARACTER_WIDTH * 4) +
-    (0b10010 << CHARACTER_WIDTH * 5): "R",
-
-    (0b01110 << CHARACTER_WIDTH * 0) +
-    (0b10000 << CHARACTER_WIDTH * 1) +
-    (0b10000 << CHARACTER_WIDTH * 2) +
-    (0b01100 << CHARACTER_WIDTH * 3) +
-    (0b00010 << CHARACTER_WIDTH * 4) +
-    (0b11100 << CHARACTER_WIDTH * 5): "S",
-
-    (0b10010 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b10010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b01100 << CHARACTER_WIDTH * 5): "U",
-
-    (0b10001 << CHARACTER_WIDTH * 0) +
-    (0b10001 << CHARACTER_WIDTH * 1) +
-    (0b01010 << CHARACTER_WIDTH * 2) +
-    (0b00100 << CHARACTER_WIDTH * 3) +
-    (0b00100 << CHARACTER_WIDTH * 4) +
-    (0b00100 << CHARACTER_WIDTH * 5): "Y",
-
-    (0b11110 << CHARACTER_WIDTH * 0) +
-    (0b00010 << CHARACTER_WIDTH * 1) +
-    (0b00100 << CHARACTER_WIDTH * 2) +
-    (0b01000 << CHARACTER_WIDTH * 3) +
-    (0b10000 << CHARACTER_WIDTH * 4) +
-    (0b11110 << CHARACTER_WIDTH * 5): "Z"
-}
 
 
 def print_screen(screen: List[complex], width: int, height: int):
@@ -193,20 +60,11 @@ def run_instructions(instructions: List[Instruction], width: int, height: int) -
     return screen
 
 
-def get_character_in_screen(screen: List[complex], index: int, width: int, height: int) -> str:
-    screen_value = sum(2**(width - 1 - x) << (y * width)
-                       for y, x in product(range(height), range(width))
-                       if (width * index + x) + y * 1j in screen)
-    return LETTERS[screen_value]
-
-
 def solve(instructions: List[Instruction]) -> Tuple[int, str]:
     screen = run_instructions(instructions, SCREEN_WIDTH, SCREEN_HEIGHT)
     return (
         len(screen),
-        "".join(map(lambda index:
-                    get_character_in_screen(screen, index,
-                                            CHARACTER_WIDTH, SCREEN_HEIGHT), range(SCREEN_WIDTH // CHARACTER_WIDTH)))
+        read_points(((int(position.real), int(position.imag)) for position in screen), (0, 0))
     )
 
 
@@ -4,36 +4,14 @@ import sys
 import os
 import time
 from typing import Dict, List, Tuple
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "lib", "py"))
+from assembunny import AssembunnyComputer
 
 Instruction = List[str]
 
 
 def run_instructions(instructions: List[Instruction], inputs: Dict[str, int] = {}) -> int:
-    registers = {register: 0 for register in ["a", "b", "c", "d"]}
-    registers.update(inputs)
-    pointer = 0
-    while pointer < len(instructions):
-        mnemonic, *params = instructions[pointer]
-        # print(instructions[pointer])
-        if mnemonic == "cpy":
-            source_param, target_param = params
-            registers[target_param] = int(
-                source_param) if source_param.isnumeric() else registers[source_param]
-            pointer += 1
-        elif mnemonic == "inc":
-            registers[params[0]] += 1
-            pointer += 1
-        elif mnemonic == "dec":
-            registers[params[0]] -= 1
-            pointer += 1
-        elif mnemonic == "jnz":
-            register, jump = params
-            if register.isnumeric() or registers[register]:
-                pointer += int(jump)
-            else:
-                pointer += 1
-        # print(pointer, registers); input()
-    return registers["a"]
+    return AssembunnyComputer(instructions, inputs).run()["a"]
 
 
 def solve(instructions: List[Instruction]) -> Tuple[int, int]:
@@ -3,35 +3,51 @@
 import sys
 import os
 import time
-from typing import Dict, List, Tuple
+from typing import Deque, Optional, Set, Tuple
+from collections import Counter, deque
+from itertools import count, islice
 import re
-from hashlib import md5
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "lib", "py"))
+from md5mining import generate_hashes
 
 
-triplet_regex = re.compile(r"(.)\1{2}")
-quintet_regex = re.compile(r"(.)\1{4}")
+LOOKAHEAD = 1000
+KEY_COUNT = 64
+RUN_REGEX = re.compile(rb"(.)\1{2,}")
+
+IndexedHash = Tuple[Optional[int], Set[int]]
+
+
+def index_hash(hash: bytes) -> IndexedHash:
+    triplet: Optional[int] = None
+    quintets: Set[int] = set()
+    for match in RUN_REGEX.finditer(hash):
+        digit = hash[match.start()]
+        if triplet is None:
+            triplet = digit
+        if match.end() - match.start() >= 5:
+            quintets.add(digit)
+    return triplet, quintets
+
 
 def find_key(salt: str, stretch: int) -> int:
-    index = 0
-    keys: List[int] = []
-    threes: Dict[str, List[int]] = {digit: [] for digit in "0123456789abcdef"}
-    while not (len(keys) > 64 and (index - keys[-1]) > 1000):
-        value = salt + str(index)
-        for _ in range(stretch + 1):
-            value = md5(value.encode()).hexdigest()
-        match = quintet_regex.search(value)
-        if match:
-            digit = match.group()[0]
-            for triplet_index in threes[digit]:
-                if (index - triplet_index) <= 1000:
-                    keys.append(triplet_index)
-            threes[digit] = []
-        match = triplet_regex.search(value)
-        if match:
-            threes[match.group()[0]].append(index)
-        index += 1
-    keys.sort()
-    return keys[63]
+    hashes = map(index_hash, generate_hashes(salt, stretch))
+    # window[0] is the candidate index, window[1:] the hashes it looks ahead to
+    window: Deque[IndexedHash] = deque(islice(hashes, LOOKAHEAD + 1))
+    quintet_counts: Counter = Counter()
+    for _, quintets in islice(window, 1, None):
+        quintet_counts.update(quintets)
+    keys_found = 0
+    for index in count():
+        triplet, _ = window.popleft()
+        if triplet is not None and quintet_counts[triplet]:
+            keys_found += 1
+            if keys_found == KEY_COUNT:
+                return index
+        quintet_counts.subtract(window[0][1])
+        window.append(next(hashes))
+        quintet_counts.update(window[-1][1])
+    raise Exception("Key not found")
 
 
 def solve(salt: str) -> Tuple[int, int]:
@@ -2,33 +2,36 @@
 
 import sys, os, time
 from typing import Tuple
+from array import array
 
 
-class Elf:
-    def __init__(self, position: int):
-        self.position = position + 1
-        self.next = self
-        self.previous = self
+def steal_from_across(elf_count: int) -> int:
+    # One next pointer per elf; before points to the elf just before the one to steal from,
+    # which moves one further every other steal as the circle shrinks
+    next_elves = array("i", range(1, elf_count + 1))
+    next_elves[-1] = 0
+    before = (elf_count // 2 - 1) % elf_count
+    remaining = elf_count
+    while remaining > 1:
+        next_elves[before] = next_elves[next_elves[before]]
+        remaining -= 1
+        if remaining % 2 == 0:
+            before = next_elves[before]
+    return before + 1
 
-    def remove(self):
-        self.previous.next = self.next
-        self.next.previous = self.previous
 
-
-def part2(elf_count: int) -> int:
-    elves = list(map(Elf, range(elf_count)))
-    for index in range(elf_count):
-        elves[index].next = elves[(index + 1) % elf_count]
-        elves[index].previous = elves[(index -1 ) % elf_count]
-    current_elf = elves[0]
-    elf_to_remove = elves[elf_count // 2]
-    for index in range(elf_count - 1):
-        elf_to_remove.remove()
-        elf_to_remove = elf_to_remove.next
-        if (elf_count - index) % 2 == 1:
-            elf_to_remove = elf_to_remove.next
-        current_elf = current_elf.next
-    return current_elf.position
+def part2(elf_count: int, simulate: bool = False) -> int:
+    if simulate:
+        return steal_from_across(elf_count)
+    # Winners count up by one from 1 after each power of 3, then by two once past its double
+    power = 1
+    while power * 3 <= elf_count:
+        power *= 3
+    if elf_count == power:
+        return elf_count
+    if elf_count - power <= power:
+        return elf_count - power
+    return 2 * elf_count - 3 * power
 
 
 def solve(elf_count: int) -> Tuple[int,int]:
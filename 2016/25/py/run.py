@@ -4,12 +4,15 @@ import sys
 import os
 import time
 from typing import List, Tuple
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "lib", "py"))
+from assembunny import AssembunnyComputer
 
 Instruction = List[str]
 
 
 def solve(instructions: List[Instruction]) -> Tuple[int, str]:
-    target = int(instructions[1][1]) * int(instructions[2][1])
+    # The program emits the bits of a + d, with d set up before the first output
+    target = AssembunnyComputer(instructions).run(1)["d"]
     a = 1
     while a < target:
         if a % 2 == 0:
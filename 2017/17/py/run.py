@@ -3,25 +3,77 @@
 import sys
 import os
 import time
-from typing import Tuple
+from typing import List, Tuple
 
 
-def part1(steps: int) -> int:
-    spin_lock = [0]
+INSERTIONS1 = 2017
+INSERTIONS2 = 5 * 10 ** 7
+BLOCK_SIZE = 1024
+
+
+class BlockList():
+    # List split in blocks, so an insert only shifts the values of one block. Lookups walk from
+    # the block of the previous one, as the spinlock only moves a little forward each time
+    def __init__(self, values: List[int]):
+        self.blocks = [list(values)]
+        self.size = len(values)
+        self.cursor = (0, 0)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _find(self, index: int) -> Tuple[int, int]:
+        block_index, start = self.cursor
+        if index < start:
+            block_index, start = 0, 0
+        while block_index < len(self.blocks) - 1 and index >= start + len(self.blocks[block_index]):
+            start += len(self.blocks[block_index])
+            block_index += 1
+        self.cursor = (block_index, start)
+        return block_index, index - start
+
+    def __getitem__(self, index: int) -> int:
+        block_index, index = self._find(index)
+        return self.blocks[block_index][index]
+
+    def insert(self, index: int, value: int):
+        block_index, index = self._find(index)
+        block = self.blocks[block_index]
+        block.insert(index, value)
+        if len(block) > 2 * BLOCK_SIZE:
+            self.blocks[block_index:block_index + 1] = [block[:BLOCK_SIZE], block[BLOCK_SIZE:]]
+        self.size += 1
+
+
+def part1(steps: int, insertions: int = INSERTIONS1) -> int:
+    spin_lock = BlockList([0])
     position = 0
-    for number in range(1, 2017 + 1):
+    for number in range(1, insertions + 1):
         position = (position + steps) % len(spin_lock) + 1
         spin_lock.insert(position, number)
-    return spin_lock[position + 1]
+    return spin_lock[(position + 1) % len(spin_lock)]
 
 
-def part2(steps: int) -> int:
+def part2(steps: int, insertions: int = INSERTIONS2) -> int:
+    # 0 never moves from the start, so only inserts right after it matter. While the position
+    # does not wrap around, each insert just moves it steps + 1 forward: skip those at once
     position = 0
     result = 0
-    for number in range(1, 5 * 10 ** 7 + 1):
+    number = 1
+    while number <= insertions:
+        if steps:
+            skip = (number - position - 1) // steps
+        else:
+            skip = insertions if position else 0
+        skip = max(0, min(skip, insertions - number + 1))
+        position += skip * (steps + 1)
+        number += skip
+        if number > insertions:
+            break
         position = ((position + steps) % number) + 1
         if (position == 1):
             result = number
+        number += 1
     return result
 
 
@@ -3,10 +3,10 @@
 import sys
 import os
 import time
-from typing import Dict, List, Set, Tuple
+from typing import List, Optional, Set, Tuple
 import re
 import math
-from collections import defaultdict
+import heapq
 
 Values = Tuple[int, ...]
 Particle = Tuple[Values, Values, Values]
@@ -32,57 +32,59 @@ def part1(particles: List[Particle]) -> int:
     return closest_particle
 
 
-def get_quadratic_abc(particle_a: Particle, particle_b: Particle, coordinate: int) -> Tuple[float, float, int]:
-    p_a_p = particle_a[0][coordinate]
-    p_a_a = particle_a[2][coordinate]
-    p_a_v = particle_a[1][coordinate] + p_a_a / 2
-    p_b_p = particle_b[0][coordinate]
-    p_b_a = particle_b[2][coordinate]
-    p_b_v = particle_b[1][coordinate] + p_b_a / 2
-    return (p_a_a - p_b_a) / 2, p_a_v - p_b_v, p_a_p - p_b_p
+# Per axis, twice the position at step t is a * t^2 + b * t + c
+Quadratic = Tuple[int, int, int]
 
 
-def get_colition_times(particle_a: Particle, particle_b: Particle) -> List[int]:
-    a, b, c = get_quadratic_abc(particle_a, particle_b, 0)
-    times: List[float] = []
+def get_quadratics(particle: Particle) -> List[Quadratic]:
+    position, velocity, acceleration = particle
+    return [(acceleration[axis], 2 * velocity[axis] + acceleration[axis], 2 * position[axis]) for axis in range(3)]
+
+
+def get_roots(a: int, b: int, c: int) -> Optional[List[int]]:
+    # Non negative integer roots, or None when every step is one
     if a == 0:
-        if b != 0:
-            times.append(-c / b)
-    else:
-        bb = b * b
-        ac4 = a * c * 4
-        if bb < ac4:
-            return []
-        elif bb == ac4:
-            times.append(-b / (2 * a))
+        if b == 0:
+            return None if c == 0 else []
+        return [-c // b] if -c % b == 0 and -c // b >= 0 else []
+    discriminant = b * b - 4 * a * c
+    if discriminant < 0:
+        return []
+    root = math.isqrt(discriminant)
+    if root * root != discriminant:
+        return []
+    return [numerator // (2 * a) for numerator in {-b + root, -b - root}
+            if numerator % (2 * a) == 0 and numerator // (2 * a) >= 0]
+
+
+def get_colition_times(quadratics_a: List[Quadratic], quadratics_b: List[Quadratic]) -> List[int]:
+    times: Optional[List[int]] = None
+    for (a1, b1, c1), (a2, b2, c2) in zip(quadratics_a, quadratics_b):
+        a, b, c = a1 - a2, b1 - b2, c1 - c2
+        if times is None:
+            times = get_roots(a, b, c)
         else:
-            rt = math.sqrt(bb - ac4)
-            times.append((-b + rt) / (2 * a))
-            times.append((-b - rt) / (2 * a))
-    int_times = map(int, filter(lambda t: t >= 0 and round(t) == t, times))
-    result: List[int] = []
-    for t in int_times:
-        collide = True
-        for k in [1, 2]:
-            a, b, c = get_quadratic_abc(particle_a, particle_b, k)
-            if a * t * t + b * t + c != 0:
-                collide = False
-                break
-        if collide:
-            result.append(t)
-    return result
+            times = [time for time in times if a * time * time + b * time + c == 0]
+        if times == []:
+            return times
+    return [0] if times is None else times
 
 
 def part2(particles: List[Particle]) -> int:
-    collisions: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+    quadratics = [get_quadratics(particle) for particle in particles]
+    collisions: List[Tuple[int, int, int]] = []
     for this_index in range(len(particles) - 1):
         for other_index in range(this_index + 1, len(particles)):
-            for time in get_colition_times(particles[this_index], particles[other_index]):
-                collisions[time].append((this_index, other_index))
+            for time in get_colition_times(quadratics[this_index], quadratics[other_index]):
+                collisions.append((time, this_index, other_index))
+    heapq.heapify(collisions)
     particle_indexes: Set[int] = set(range(len(particles)))
-    for time in sorted(list(collisions.keys())):
+    while collisions:
+        # Collisions at the same step all happen, even when a particle is in several
+        time = collisions[0][0]
         collided_to_temove: Set[int] = set()
-        for index_a, index_b in collisions[time]:
+        while collisions and collisions[0][0] == time:
+            _, index_a, index_b = heapq.heappop(collisions)
             if index_a in particle_indexes and index_b in particle_indexes:
                 collided_to_temove.add(index_a)
                 collided_to_temove.add(index_b)
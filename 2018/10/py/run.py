@@ -4,304 +4,14 @@ import sys
 import os
 import time
 from typing import List, Tuple
-from itertools import product
 import re
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "lib", "py"))
+from ocr import read_points
 
 Point = complex
 PointPair = Tuple[Point, complex]
 PointPairs = List[PointPair]
 
-CHARACTER_WIDTH = 6
-CHARACTER_PADDING = 2
-CHARACTER_HEIGHT = 10
-LETTERS = {
-    (0b001100 << CHARACTER_WIDTH * 0) +
-    (0b010010 << CHARACTER_WIDTH * 1) +
-    (0b100001 << CHARACTER_WIDTH * 2) +
-    (0b100001 << CHARACTER_WIDTH * 3) +
-    (0b100001 << CHARACTER_WIDTH * 4) +
-    (0b111111 << CHARACTER_WIDTH * 5) +
-    (0b100001 << CHARACTER_WIDTH * 6) +
-    (0b100001 << CHARACTER_WIDTH * 7) +
-    (0b100001 << CHARACTER_WIDTH * 8) +
-    (0b100001 << CHARACTER_WIDTH * 9): "A",
-
-    (0b111110 << CHARACTER_WIDTH * 0) +
-    (0b100001 << CHARACTER_WIDTH * 1) +
-    (0b100001 << CHARACTER_WIDTH * 2) +
-    (0b100001 << CHARACTER_WIDTH * 3) +
-    (0b111110 << CHARACTER_WIDTH * 4) +
-    (0b100001 << CHARACTER_WIDTH * 5) +
-    (0b100001 << CHARACTER_WIDTH * 6) +
-    (0b100001 << CHARACTER_WIDTH * 7) +
-    (0b100001 << CHARACTER_WIDTH * 8) +
-    (0b111110 << CHARACTER_WIDTH * 9): "B",
-
-    (0b011110 << CHARACTER_WIDTH * 0) +
-    (0b100001 << CHARACTER_WIDTH * 1) +
-    (0b100000 << CHARACTER_WIDTH * 2) +
-    (0b100000 << CHARACTER_WIDTH * 3) +
-    (0b100000 << CHARACTER_WIDTH * 4) +
-    (0b100000 << CHARACTER_WIDTH * 5) +
-    (0b100000 << CHARACTER_WIDTH * 6) +
-    (0b100000 << CHARACTER_WIDTH * 7) +
-    (0b100001 << CHARACTER_WIDTH * 8) +
-    (0b011110 << CHARACTER_WIDTH * 9): "C",
-
-    (0b111110 << CHARACTER_WIDTH * 0) +
-    (0b100001 << CHARACTER_WIDTH * 1) +
-    (0b100001 << CHARACTER_WIDTH * 2) +
-    (0b100001 << CHARACTER_WIDTH * 3) +
-    (0b100001 << CHARACTER_WIDTH * 4) +
-    (0b100001 << CHARACTER_WIDTH * 5) +
-    (0b100001 << CHARACTER_WIDTH * 6) +
-    (0b100001 << CHARACTER_WIDTH * 7) +
-    (0b100001 << CHARACTER_WIDTH * 8) +
-    (0b111110 << CHARACTER_WIDTH * 9): "D",
-
-    (0b111111 << CHARACTER_WIDTH * 0) +
-    (0b100000 << CHARACTER_WIDTH * 1) +
-    (0b100000 << CHARACTER_WIDTH * 2) +
-    (0b100000 << CHARACTER_WIDTH * 3) +
-    (0b111110 << CHARACTER_WIDTH * 4) +
-    (0b100000 << CHARACTER_WIDTH * 5) +
-    (0b100000 << CHARACTER_WIDTH * 6) +
-    (0b100000 << CHARACTER_WIDTH * 7) +
-    (0b100000 << CHARACTER_WIDTH * 8) +
-    (0b111111 << CHARACTER_WIDTH * 9): "E",
-
-    (0b111111 << CHARACTER_WIDTH * 0) +
-    (0b100000 << CHARACTER_WIDTH * 1) +
-    (0b100000 << CHARACTER_WIDTH * 2) +
-    (0b100000 << CHARACTER_WIDTH * 3) +
-    (0b111110 << CHARACTER_WIDTH * 4) +
-    (0b100000 << CHARACTER_WIDTH * 5) +
-    (0b100000 << CHARACTER_WIDTH * 6) +
-    (0b100000 << CHARACTER_WIDTH * 7) +
-    (0b100000 << CHARACTER_WIDTH * 8) +
-    (0b100000 << CHARACTER_WIDTH * 9): "F",
-
-    (0b011110 << CHARACTER_WIDTH * 0) +
-    (0b100001 << CHARACTER_WIDTH * 1) +
-    (0b100000 << CHARACTER_WIDTH * 2) +
-    (0b100000 << CHARACTER_WIDTH * 3) +
-    (0b100000 << CHARACTER_WIDTH * 4) +
-    (0b100111 << CHARACTER_WIDTH * 5) +
-    (0b100001 << CHARACTER_WIDTH * 6) +
-    (0b100001 << CHARACTER_WIDTH * 7) +
-    (0b100011 << CHARACTER_WIDTH * 8) +
-    (0b011101 << CHARACTER_WIDTH * 9): "G",
-
-    (0b100001 << CHARACTER_WIDTH * 0) +
-    (0b100001 << CHARACTER_WIDTH * 1) +
-    (0b100001 << CHARACTER_WIDTH * 2) +
-    (0b100001 << CHARACTER_WIDTH * 3) +
-    (0b111111 << CHARACTER_WIDTH * 4) +
-    (0b100001 << CHARACTER_WIDTH * 5) +
-    (0b100001 << CHARACTER_WIDTH * 6) +
-    (0b100001 << CHARACTER_WIDTH * 7) +
-    (0b100001 << CHARACTER_WIDTH * 8) +
-    (0b100001 << CHARACTER_WIDTH * 9): "H",
-
-    (0b111000 << CHARACTER_WIDTH * 0) +
-    (0b010000 << CHARACTER_WIDTH * 1) +
-    (0b010000 << CHARACTER_WIDTH * 2) +
-    (0b010000 << CHARACTER_WIDTH * 3) +
-    (0b010000 << CHARACTER_WIDTH * 4) +
-    (0b010000 << CHARACTER_WIDTH * 5) +
-    (0b010000 << CHARACTER_WIDTH * 6) +
-    (0b010000 << CHARACTER_WIDTH * 7) +
-    (0b010000 << CHARACTER_WIDTH * 8) +
-    (0b111000 << CHARACTER_WIDTH * 9): "I",  # Not sure
-
-    (0b000111 << CHARACTER_WIDTH * 0) +
-    (0b000010 << CHARACTER_WIDTH * 1) +
-    (0b000010 << CHARACTER_WIDTH * 2) +
-    (0b000010 << CHARACTER_WIDTH * 3) +
-    (0b000010 << CHARACTER_WIDTH * 4) +
-    (0b000010 << CHARACTER_WIDTH * 5) +
-    (0b000010 << CHARACTER_WIDTH * 6) +
-    (0b100010 << CHARACTER_WIDTH * 7) +
-    (0b100010 << CHARACTER_WIDTH * 8) +
-    (0b011100 << CHARACTER_WIDTH * 9): "J",
-
-    (0b100001 << CHARACTER_WIDTH * 0) +
-    (0b100010 << CHARACTER_WIDTH * 1) +
-    (0b100100 << CHARACTER_WIDTH * 2) +
-    (0b101000 << CHARACTER_WIDTH * 3) +
-    (0b110000 << CHARACTER_WIDTH * 4) +
-    (0b110000 << CHARACTER_WIDTH * 5) +
-    (0b101000 << CHARACTER_WIDTH * 6) +
-    (0b100100 << CHARACTER_WIDTH * 7) +
-    (0b100010 << CHARACTER_WIDTH * 8) +
-    (0b100001 << CHARACTER_WIDTH * 9): "K",
-
-    (0b100000 << CHARACTER_WIDTH * 0) +
-    (0b100000 << CHARACTER_WIDTH * 1) +
-    (0b100000 << CHARACTER_WIDTH * 2) +
-    (0b100000 << CHARACTER_WIDTH * 3) +
-    (0b100000 << CHARACTER_WIDTH * 4) +
-    (0b100000 << CHARACTER_WIDTH * 5) +
-    (0b100000 << CHARACTER_WIDTH * 6) +
-    (0b100000 << CHARACTER_WIDTH * 7) +
-    (0b100000 << CHARACTER_WIDTH * 8) +
-    (0b111111 << CHARACTER_WIDTH * 9): "L",
-
-    (0b100001 << CHARACTER_WIDTH * 0) +
-    (0b110011 << CHARACTER_WIDTH * 1) +
-    (0b110011 << CHARACTER_WIDTH * 2) +
-    (0b101101 << CHARACTER_WIDTH * 3) +
-    (0b100001 << CHARACTER_WIDTH * 4) +
-    (0b100001 << CHARACTER_WIDTH * 5) +
-    (0b100001 << CHARACTER_WIDTH * 6) +
-    (0b100001 << CHARACTER_WIDTH * 7) +
-    (0b100001 << CHARACTER_WIDTH * 8) +
-    (0b100001 << CHARACTER_WIDTH * 9): "M",  # Not sure
-
-    (0b100001 << CHARACTER_WIDTH * 0) +
-    (0b110001 << CHARACTER_WIDTH * 1) +
-    (0b110001 << CHARACTER_WIDTH * 2) +
-    (0b101001 << CHARACTER_WIDTH * 3) +
-    (0b101001 << CHARACTER_WIDTH * 4) +
-    (0b100101 << CHARACTER_WIDTH * 5) +
-    (0b100101 << CHARACTER_WIDTH * 6) +
-    (0b100011 << CHARACTER_WIDTH * 7) +
-    (0b100011 << CHARACTER_WIDTH * 8) +
-    (0b100001 << CHARACTER_WIDTH * 9): "N",
-
-    (0b011110 << CHARACTER_WIDTH * 0) +
-    (0b100001 << CHARACTER_WIDTH * 1) +
-    (0b100001 << CHARACTER_WIDTH * 2) +
-    (0b100001 << CHARACTER_WIDTH * 3) +
-    (0b100001 << CHARACTER_WIDTH * 4) +
-    (0b100001 << CHARACTER_WIDTH * 5) +
-    (0b100001 << CHARACTER_WIDTH * 6) +
-    (0b100001 << CHARACTER_WIDTH * 7) +
-    (0b100001 << CHARACTER_WIDTH * 8) +
-    (0b011110 << CHARACTER_WIDTH * 9): "O",
-
-    (0b111110 << CHARACTER_WIDTH * 0) +
-    (0b100001 << CHARACTER_WIDTH * 1) +
-    (0b100001 << CHARACTER_WIDTH * 2) +
-    (0b100001 << CHARACTER_WIDTH * 3) +
-    (0b111110 << CHARACTER_WIDTH * 4) +
-    (0b100000 << CHARACTER_WIDTH * 5) +
-    (0b100000 << CHARACTER_WIDTH * 6) +
-    (0b100000 << CHARACTER_WIDTH * 7) +
-    (0b100000 << CHARACTER_WIDTH * 8) +
-    (0b100000 << CHARACTER_WIDTH * 9): "P",
-
-    (0b011110 << CHARACTER_WIDTH * 0) +
-    (0b100001 << CHARACTER_WIDTH * 1) +
-    (0b100001 << CHARACTER_WIDTH * 2) +
-    (0b100001 << CHARACTER_WIDTH * 3) +
-    (0b100001 << CHARACTER_WIDTH * 4) +
-    (0b100001 << CHARACTER_WIDTH * 5) +
-    (0b100001 << CHARACTER_WIDTH * 6) +
-    (0b100101 << CHARACTER_WIDTH * 7) +
-    (0b100110 << CHARACTER_WIDTH * 8) +
-    (0b011001 << CHARACTER_WIDTH * 9): "Q",  # Not sure
-
-    (0b111110 << CHARACTER_WIDTH * 0) +
-    (0b100001 << CHARACTER_WIDTH * 1) +
-    (0b100001 << CHARACTER_WIDTH * 2) +
-    (0b100001 << CHARACTER_WIDTH * 3) +
-    (0b111110 << CHARACTER_WIDTH * 4) +
-    (0b100100 << CHARACTER_WIDTH * 5) +
-    (0b100010 << CHARACTER_WIDTH * 6) +
-    (0b100010 << CHARACTER_WIDTH * 7) +
-    (0b100001 << CHARACTER_WIDTH * 8) +
-    (0b100001 << CHARACTER_WIDTH * 9): "R",
-
-    (0b011110 << CHARACTER_WIDTH * 0) +
-    (0b100001 << CHARACTER_WIDTH * 1) +
-    (0b100000 << CHARACTER_WIDTH * 2) +
-    (0b100000 << CHARACTER_WIDTH * 3) +
-    (0b011110 << CHARACTER_WIDTH * 4) +
-    (0b000001 << CHARACTER_WIDTH * 5) +
-    (0b000001 << CHARACTER_WIDTH * 6) +
-    (0b000001 << CHARACTER_WIDTH * 7) +
-    (0b100001 << CHARACTER_WIDTH * 8) +
-    (0b011110 << CHARACTER_WIDTH * 9): "S",
-
-    (0b111110 << CHARACTER_WIDTH * 0) +
-    (0b001000 << CHARACTER_WIDTH * 1) +
-    (0b001000 << CHARACTER_WIDTH * 2) +
-    (0b001000 << CHARACTER_WIDTH * 3) +
-    (0b001000 << CHARACTER_WIDTH * 4) +
-    (0b001000 << CHARACTER_WIDTH * 5) +
-    (0b001000 << CHARACTER_WIDTH * 6) +
-    (0b001000 << CHARACTER_WIDTH * 7) +
-    (0b001000 << CHARACTER_WIDTH * 8) +
-    (0b001000 << CHARACTER_WIDTH * 9): "T",  # Not sure
-
-    (0b100001 << CHARACTER_WIDTH * 0) +
-    (0b100001 << CHARACTER_WIDTH * 1) +
-    (0b100001 << CHARACTER_WIDTH * 2) +
-    (0b100001 << CHARACTER_WIDTH * 3) +
-    (0b100001 << CHARACTER_WIDTH * 4) +
-    (0b100001 << CHARACTER_WIDTH * 5) +
-    (0b100001 << CHARACTER_WIDTH * 6) +
-    (0b100001 << CHARACTER_WIDTH * 7) +
-    (0b100001 << CHARACTER_WIDTH * 8) +
-    (0b011110 << CHARACTER_WIDTH * 9): "U",
-
-    (0b100001 << CHARACTER_WIDTH * 0) +
-    (0b100001 << CHARACTER_WIDTH * 1) +
-    (0b100001 << CHARACTER_WIDTH * 2) +
-    (0b100001 << CHARACTER_WIDTH * 3) +
-    (0b100001 << CHARACTER_WIDTH * 4) +
-    (0b100001 << CHARACTER_WIDTH * 5) +
-    (0b100001 << CHARACTER_WIDTH * 6) +
-    (0b010010 << CHARACTER_WIDTH * 7) +
-    (0b010010 << CHARACTER_WIDTH * 8) +
-    (0b001100 << CHARACTER_WIDTH * 9): "V",  # Not sure
-
-    (0b100001 << CHARACTER_WIDTH * 0) +
-    (0b100001 << CHARACTER_WIDTH * 1) +
-    (0b100001 << CHARACTER_WIDTH * 2) +
-    (0b100001 << CHARACTER_WIDTH * 3) +
-    (0b100001 << CHARACTER_WIDTH * 4) +
-    (0b100001 << CHARACTER_WIDTH * 5) +
-    (0b101101 << CHARACTER_WIDTH * 6) +
-    (0b101101 << CHARACTER_WIDTH * 7) +
-    (0b110011 << CHARACTER_WIDTH * 8) +
-    (0b100001 << CHARACTER_WIDTH * 9): "W",  # Not sure
-
-    (0b100001 << CHARACTER_WIDTH * 0) +
-    (0b100001 << CHARACTER_WIDTH * 1) +
-    (0b010010 << CHARACTER_WIDTH * 2) +
-    (0b010010 << CHARACTER_WIDTH * 3) +
-    (0b001100 << CHARACTER_WIDTH * 4) +
-    (0b001100 << CHARACTER_WIDTH * 5) +
-    (0b010010 << CHARACTER_WIDTH * 6) +
-    (0b010010 << CHARACTER_WIDTH * 7) +
-    (0b100001 << CHARACTER_WIDTH * 8) +
-    (0b100001 << CHARACTER_WIDTH * 9): "X",
-
-    (0b100010 << CHARACTER_WIDTH * 0) +
-    (0b100010 << CHARACTER_WIDTH * 1) +
-    (0b010100 << CHARACTER_WIDTH * 2) +
-    (0b010100 << CHARACTER_WIDTH * 3) +
-    (0b001000 << CHARACTER_WIDTH * 4) +
-    (0b001000 << CHARACTER_WIDTH * 5) +
-    (0b001000 << CHARACTER_WIDTH * 6) +
-    (0b001000 << CHARACTER_WIDTH * 7) +
-    (0b001000 << CHARACTER_WIDTH * 8) +
-    (0b001000 << CHARACTER_WIDTH * 9): "Y",  # Not sure
-
-    (0b111111 << CHARACTER_WIDTH * 0) +
-    (0b000001 << CHARACTER_WIDTH * 1) +
-    (0b000001 << CHARACTER_WIDTH * 2) +
-    (0b000010 << CHARACTER_WIDTH * 3) +
-    (0b000100 << CHARACTER_WIDTH * 4) +
-    (0b001000 << CHARACTER_WIDTH * 5) +
-    (0b010000 << CHARACTER_WIDTH * 6) +
-    (0b100000 << CHARACTER_WIDTH * 7) +
-    (0b100000 << CHARACTER_WIDTH * 8) +
-    (0b111111 << CHARACTER_WIDTH * 9): "Z"
-}
-
 
 def print_points(point_pairs: List[PointPair]):
     _, minX, maxX, minY, maxY = get_dimensions(point_pairs)
@@ -325,41 +35,64 @@ def get_dimensions(points: List[PointPair]) -> Tuple[Tuple[int, int], int, int,
     return size, min_x, max_x, min_y, max_y
 
 
-def get_next_state(points: List[PointPair]) -> List[PointPair]:
-    new_state: List[PointPair] = []
-    for point, velocity in points:
-        new_state.append((point + velocity, velocity))
-    return new_state
-
-
-def get_character(minX: int, minY: int, index: int, charaterWidth: int, points: List[Point]) -> str:
-    screenValue = sum(2**(CHARACTER_WIDTH - 1 - x) << (y * CHARACTER_WIDTH)
-                      for y, x in product(range(CHARACTER_HEIGHT), range(CHARACTER_WIDTH))
-                      if (charaterWidth * index + x + minX) + (y + minY) * 1j in points)
-    return LETTERS[screenValue]
-
-
-def get_message(pointPairs: List[PointPair]) -> Tuple[bool, str]:
-    points = [point[0] for point in pointPairs]
-    (width, _), min_x, _, min_y, _ = get_dimensions(pointPairs)
-    character_width = CHARACTER_WIDTH + CHARACTER_PADDING
-    try:
-        return True, "".join(map(lambda index:
-                                 get_character(min_x, min_y, index, character_width, points), range((width // character_width) + 1)))
-    except:
-        return False, ""
+def get_state(point_pairs: List[PointPair], seconds: int) -> List[PointPair]:
+    return [(point + velocity * seconds, velocity) for point, velocity in point_pairs]
+
+
+def get_spread(point_pairs: List[PointPair], seconds: int) -> float:
+    # Bounding box width plus height, a convex function of time
+    xs = [point.real + velocity.real * seconds for point, velocity in point_pairs]
+    ys = [point.imag + velocity.imag * seconds for point, velocity in point_pairs]
+    return max(xs) - min(xs) + max(ys) - min(ys)
+
+
+def estimate_time(point_pairs: List[PointPair]) -> int:
+    # The two points with the most opposed vertical velocities meet about when the message forms
+    upwards = min(point_pairs, key=lambda point_pair: point_pair[1].imag)
+    downwards = max(point_pairs, key=lambda point_pair: point_pair[1].imag)
+    closing_speed = downwards[1].imag - upwards[1].imag
+    if not closing_speed:
+        return 0
+    return max(0, int((upwards[0].imag - downwards[0].imag) // closing_speed))
+
+
+def find_convergence(point_pairs: List[PointPair]) -> int:
+    # First second the spread stops shrinking; as the spread is convex, this is a binary search
+    def is_converged(seconds: int) -> bool:
+        return get_spread(point_pairs, seconds + 1) >= get_spread(point_pairs, seconds)
+
+    estimate = estimate_time(point_pairs)
+    step = 1
+    if is_converged(estimate):
+        low, high = estimate, estimate
+        while low > 0 and is_converged(low):
+            high = low
+            low = max(0, low - step)
+            step *= 2
+        if is_converged(low):
+            return low
+    else:
+        low, high = estimate, estimate + step
+        while not is_converged(high):
+            low = high
+            step *= 2
+            high += step
+    while high - low > 1:
+        middle = (low + high) // 2
+        if is_converged(middle):
+            high = middle
+        else:
+            low = middle
+    return high
+
+
+def get_message(point_pairs: List[PointPair]) -> str:
+    return read_points((int(point.real), int(point.imag)) for point, _ in point_pairs)
 
 
 def solve(point_pairs: List[PointPair]) -> Tuple[str, int]:
-    iterations = 0
-    while True:
-        (_, height), *_ = get_dimensions(point_pairs)
-        if height == CHARACTER_HEIGHT:
-            success, message = get_message(point_pairs)
-            if success:
-                return message, iterations
-        iterations += 1
-        point_pairs = get_next_state(point_pairs)
+    seconds = find_convergence(point_pairs)
+    return get_message(get_state(point_pairs, seconds)), seconds
 
 
 line_regex = re.compile(
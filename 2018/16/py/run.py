@@ -5,59 +5,17 @@ import os
 import time
 import re
 from typing import Dict, List, Set, Tuple
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "lib", "py"))
+from elfcode import ElfCodeComputer, MNEMONICS, execute
 
 Registers = Tuple[int, int, int, int]
 Operation = Tuple[int, int, int, int]
 Record = Tuple[Registers, Operation, Registers]
-MNEMONICS = [
-    "addr", "addi",
-    "mulr", "muli",
-    "banr", "bani",
-    "borr", "bori",
-    "setr", "seti",
-    "gtir", "gtri", "gtrr",
-    "eqir", "eqri", "eqrr"
-]
 
 
 def run_operation(registers: Registers, operation: Operation, mnemonic: str) -> Registers:
     _, a, b, c = operation
-    result = list(registers)
-    value = -1
-    if mnemonic == "addr":
-        value = registers[a] + registers[b]
-    elif mnemonic == "addi":
-        value = registers[a] + b
-    elif mnemonic == "mulr":
-        value = registers[a] * registers[b]
-    elif mnemonic == "muli":
-        value = registers[a] * b
-    elif mnemonic == "banr":
-        value = registers[a] & registers[b]
-    elif mnemonic == "bani":
-        value = registers[a] & b
-    elif mnemonic == "borr":
-        value = registers[a] | registers[b]
-    elif mnemonic == "bori":
-        value = registers[a] | b
-    elif mnemonic == "setr":
-        value = registers[a]
-    elif mnemonic == "seti":
-        value = a
-    elif mnemonic == "gtir":
-        value = 1 if a > registers[b] else 0
-    elif mnemonic == "gtri":
-        value = 1 if registers[a] > b else 0
-    elif mnemonic == "gtrr":
-        value = 1 if registers[a] > registers[b] else 0
-    elif mnemonic == "eqir":
-        value = 1 if a == registers[b] else 0
-    elif mnemonic == "eqri":
-        value = 1 if registers[a] == b else 0
-    elif mnemonic == "eqrr":
-        value = 1 if registers[a] == registers[b] else 0
-    result[c] = value
-    return tuple(result)
+    return tuple(execute(registers, (mnemonic, a, b, c)))
 
 
 def test_record(before: Registers, operation: Operation, after: Registers, opcodes: Dict[str, Set[int]]) -> int:
@@ -92,10 +50,8 @@ def solve(puzzle_input: Tuple[List[Record], List[Operation]]) -> Tuple[int, int]
                     if single in valid:
                         valid.remove(single)
     ops = {next(iter(valid)): mnemonic for mnemonic, valid in opcodes.items()}
-    registers = (0, 0, 0, 0)
-    for op in program:
-        registers = run_operation(registers, op, ops[op[0]])
-    return three_or_more, registers[0]
+    computer = ElfCodeComputer([(ops[op], a, b, c) for op, a, b, c in program], registers=(0, 0, 0, 0))
+    return three_or_more, computer.run()[0]
 
 
 record_regex = re.compile(
@@ -5,38 +5,28 @@ import os
 import time
 from typing import List, Set, Tuple
 import re
-
-Operation = Tuple[str, int, int, int]
-
-
-MASK = 16777215
-MULTIPLIER = 65899
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "lib", "py"))
+from elfcode import ElfCodeComputer, Operation
 
 
 def solve(data: Tuple[int, List[Operation]]) -> Tuple[int, int]:
-    _, operations = data
-    magic_number = operations[7][1]
-    part1_result = 0
+    ip, operations = data
+    # The program halts when the value it generates equals register 0
+    check, (_, a, b, _) = next((index, operation) for index, operation in enumerate(operations)
+                               if operation[0] == "eqrr" and 0 in operation[1:3])
+    register = b if a == 0 else a
+    computer = ElfCodeComputer(operations, ip)
     seen: Set[int] = set()
-    result = 0
-    last_result = -1
-    while True:
-        accumulator = result | 0x10000
-        result = magic_number
-        while True:
-            result = (((result + (accumulator & 0xFF)) & MASK)
-                      * MULTIPLIER) & MASK
-            if accumulator <= 0xFF:
-                if part1_result == 0:
-                    part1_result = result
-                if result not in seen:
-                    seen.add(result)
-                    last_result = result
-                    break
-                else:
-                    return part1_result, last_result
-            else:
-                accumulator //= 0x100
+    first_value = last_value = -1
+    while computer.running:
+        value = computer.run(check)[register]
+        if value in seen:
+            return first_value, last_value
+        if not seen:
+            first_value = value
+        seen.add(value)
+        last_value = value
+    raise Exception("Program halted")
 
 
 operation_regex = re.compile(
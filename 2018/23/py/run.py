@@ -4,6 +4,8 @@ import sys
 import os
 import time
 from typing import List, Tuple
+from itertools import product
+import heapq
 import re
 
 Nanobot = Tuple[int, ...]
@@ -23,45 +25,60 @@ def part1(nanobots: List[Nanobot]) -> int:
     return in_range
 
 
+Box = Tuple[int, int, int, int]
+
+
+def count_in_range(nanobots: List[Nanobot], box: Box) -> int:
+    # Bots whose range reaches any point of the cube of side size from the corner
+    x, y, z, size = box
+    last_x, last_y, last_z = x + size - 1, y + size - 1, z + size - 1
+    count = 0
+    for bot_x, bot_y, bot_z, bot_radius in nanobots:
+        distance = 0
+        if bot_x < x:
+            distance += x - bot_x
+        elif bot_x > last_x:
+            distance += bot_x - last_x
+        if bot_y < y:
+            distance += y - bot_y
+        elif bot_y > last_y:
+            distance += bot_y - last_y
+        if bot_z < z:
+            distance += z - bot_z
+        elif bot_z > last_z:
+            distance += bot_z - last_z
+        if distance <= bot_radius:
+            count += 1
+    return count
+
+
+def get_origin_distance(box: Box) -> int:
+    # Distance from the origin to the closest point of the box
+    x, y, z, size = box
+    return sum(max(start, 0, -(start + size - 1)) for start in (x, y, z))
+
+
 def part2(nanobots: List[Nanobot]) -> int:
-    all_xs = [bot[0] for bot in nanobots] + [0]
-    all_ys = [bot[1] for bot in nanobots] + [0]
-    all_zs = [bot[2] for bot in nanobots] + [0]
-    xs = (min(all_xs), max(all_xs))
-    ys = (min(all_ys), max(all_ys))
-    zs = (min(all_zs), max(all_zs))
-    location_radius = 1
-    while location_radius < xs[1] - xs[0]:
-        location_radius *= 2
-    while True:
-        hightest_count = 0
-        best_location: Tuple[int, int, int] = (0, 0, 0)
-        shortest_distance = -1
-        for x in range(xs[0], xs[1] + 1, location_radius):
-            for y in range(ys[0], ys[1] + 1, location_radius):
-                for z in range(zs[0], zs[1] + 1, location_radius):
-                    count = 0
-                    for bot_x, bot_y, bot_z, bot_radius in nanobots:
-                        bot_distance = abs(x - bot_x) + \
-                            abs(y - bot_y) + abs(z - bot_z)
-                        if (bot_distance - bot_radius) // location_radius <= 0:
-                            count += 1
-                    location_distance = abs(x) + abs(y) + abs(z)
-                    if count > hightest_count or \
-                            (count == hightest_count and (shortest_distance == -1 or location_distance < shortest_distance)):
-                        hightest_count = count
-                        shortest_distance = location_distance
-                        best_location = (x, y, z)
-        if location_radius == 1:
-            return shortest_distance
-        else:
-            xs = (best_location[0] - location_radius,
-                  best_location[0] + location_radius)
-            ys = (best_location[1] - location_radius,
-                  best_location[1] + location_radius)
-            zs = (best_location[2] - location_radius,
-                  best_location[2] + location_radius)
-            location_radius = location_radius // 2
+    # Best first search over an octree: a box's count bounds the count of every point inside,
+    # so the first single point popped is in range of the most bots and closest to the origin
+    start = min(min(bot[axis] - bot[3] for bot in nanobots) for axis in range(3))
+    end = max(max(bot[axis] + bot[3] for bot in nanobots) for axis in range(3))
+    size = 1
+    while size <= end - start:
+        size *= 2
+    box = (start, start, start, size)
+    queue = [(-len(nanobots), get_origin_distance(box), size, box)]
+    while queue:
+        _, distance, size, (x, y, z, _) = heapq.heappop(queue)
+        if size == 1:
+            return distance
+        half = size // 2
+        for dx, dy, dz in product((0, half), repeat=3):
+            box = (x + dx, y + dy, z + dz, half)
+            count = count_in_range(nanobots, box)
+            if count:
+                heapq.heappush(queue, (-count, get_origin_distance(box), half, box))
+    return 0
 
 
 def solve(nanobots: List[Nanobot]) -> Tuple[int, int]:
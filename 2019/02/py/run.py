@@ -3,45 +3,16 @@
 import sys, os, time
 from typing import List, Tuple
 from itertools import product
-
-
-class IntCodeComputer():
-    def __init__(self, memory: List[int]):
-        self.memory = list(memory)
-        self.pointer = 0
-        self.running = True
-    
-    def run(self) -> int:
-        while self.running:
-            self.tick()
-        return self.memory[0]
-    
-    def get_parameter(self, offset: int) -> int:
-        return self.memory[self.memory[self.pointer + offset]]
-
-    def get_address(self, offset: int) -> int:
-        return self.memory[self.pointer + offset]
-    
-    def tick(self):
-        if not self.running:
-            return
-        opcode = self.memory[self.pointer]
-        if opcode == 1: # ADD
-            self.memory[self.get_address(3)] = self.get_parameter(1) + self.get_parameter(2)
-            self.pointer += 4
-        elif opcode == 2: # MUL
-            self.memory[self.get_address(3)] = self.get_parameter(1) * self.get_parameter(2)
-            self.pointer += 4
-        elif opcode == 99: # HALT
-            self.running = False
-        else:
-            raise Exception(f"Unknown instruction", self.pointer, opcode)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "lib", "py"))
+from intcode import IntCodeComputer
 
 
 def run_program(memory: List[int], noun: int, verb: int) -> int:
     memory[1] = noun
     memory[2] = verb
-    return IntCodeComputer(memory).run()    
+    computer = IntCodeComputer(memory)
+    computer.run()
+    return computer.memory[0]
 
 
 TARGET_VALUE = 19690720
@@ -4,82 +4,14 @@ import sys
 import os
 import time
 from typing import List, Tuple
-
-
-class IntCodeComputer():
-    def __init__(self, memory: List[int], inputs: List[int]):
-        self.memory = list(memory)
-        self.pointer = 0
-        self.inputs = inputs
-        self.output = 0
-        self.running = True
-
-    def run(self) -> int:
-        while self.running:
-            self.tick()
-        return self.output
-
-    def get_parameter(self, offset: int, mode: int) -> int:
-        value = self.memory[self.pointer + offset]
-        if mode == 0:  # POSITION
-            return self.memory[value]
-        if mode == 1:  # IMMEDIATE
-            return value
-        raise Exception("Unrecognized parameter mode", mode)
-
-    def get_address(self, offset: int) -> int:
-        return self.memory[self.pointer + offset]
-
-    def tick(self):
-        instruction = self.memory[self.pointer]
-        opcode, p1_mode, p2_mode = instruction % 100, (
-            instruction // 100) % 10, (instruction // 1000) % 10
-        if not self.running:
-            return
-        if opcode == 1:  # ADD
-            self.memory[self.get_address(3)] = self.get_parameter(
-                1, p1_mode) + self.get_parameter(2, p2_mode)
-            self.pointer += 4
-        elif opcode == 2:  # MUL
-            self.memory[self.get_address(3)] = self.get_parameter(
-                1, p1_mode) * self.get_parameter(2, p2_mode)
-            self.pointer += 4
-        elif opcode == 3:  # INPUT
-            if self.inputs:
-                self.memory[self.get_address(1)] = self.inputs.pop(0)
-                self.pointer += 2
-        elif opcode == 4:  # OUTPUT
-            self.output = self.get_parameter(1, p1_mode)
-            self.pointer += 2
-        elif opcode == 5:  # JMP_TRUE
-            if self.get_parameter(1, p1_mode):
-                self.pointer = self.get_parameter(2, p2_mode)
-            else:
-                self.pointer += 3
-        elif opcode == 6:  # JMP_FALSE
-            if not self.get_parameter(1, p1_mode):
-                self.pointer = self.get_parameter(2, p2_mode)
-            else:
-                self.pointer += 3
-        elif opcode == 7:  # LESS_THAN
-            self.memory[self.get_address(3)] = 1 if self.get_parameter(
-                1, p1_mode) < self.get_parameter(2, p2_mode) else 0
-            self.pointer += 4
-        elif opcode == 8:  # EQUALS
-            self.memory[self.get_address(3)] = 1 if self.get_parameter(
-                1, p1_mode) == self.get_parameter(2, p2_mode) else 0
-            self.pointer += 4
-        elif opcode == 99:  # HALT
-            self.running = False
-        else:
-            raise Exception(f"Unknown instruction", self.pointer,
-                            instruction, opcode, p1_mode, p2_mode)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "lib", "py"))
+from intcode import IntCodeComputer
 
 
 def solve(memory: List[int]) -> Tuple[int, int]:
     return (
-        IntCodeComputer(memory, [1]).run(),
-        IntCodeComputer(memory, [5]).run()
+        IntCodeComputer(memory, [1]).run()[-1],
+        IntCodeComputer(memory, [5]).run()[-1]
     )
 
 
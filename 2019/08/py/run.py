@@ -3,148 +3,15 @@
 import sys
 import os
 import time
-from typing import Dict, List, Tuple
+from typing import List, Tuple
 from itertools import product
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "lib", "py"))
+from ocr import pack_row, read_bitmap
 
 
 IMAGE_WIDTH = 25
 IMAGE_HEIGHT = 6
 PIXELS_PER_LAYER = IMAGE_WIDTH * IMAGE_HEIGHT
-CHARACTER_WIDTH = 5
-LETTERS: Dict[int, str] = {
-    (0b01100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b11110 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b10010 << CHARACTER_WIDTH * 5): "A",
-
-    (0b11100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b11100 << CHARACTER_WIDTH * 2) +
-    (0b10010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b11100 << CHARACTER_WIDTH * 5): "B",
-
-    (0b01100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10000 << CHARACTER_WIDTH * 2) +
-    (0b10000 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b01100 << CHARACTER_WIDTH * 5): "C",
-
-    (0b11100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b10010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b11100 << CHARACTER_WIDTH * 5): "D",
-
-    (0b11110 << CHARACTER_WIDTH * 0) +
-    (0b10000 << CHARACTER_WIDTH * 1) +
-    (0b11100 << CHARACTER_WIDTH * 2) +
-    (0b10000 << CHARACTER_WIDTH * 3) +
-    (0b10000 << CHARACTER_WIDTH * 4) +
-    (0b11110 << CHARACTER_WIDTH * 5): "E",
-
-    (0b11110 << CHARACTER_WIDTH * 0) +
-    (0b10000 << CHARACTER_WIDTH * 1) +
-    (0b11100 << CHARACTER_WIDTH * 2) +
-    (0b10000 << CHARACTER_WIDTH * 3) +
-    (0b10000 << CHARACTER_WIDTH * 4) +
-    (0b10000 << CHARACTER_WIDTH * 5): "F",
-
-    (0b01100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10000 << CHARACTER_WIDTH * 2) +
-    (0b10110 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b01110 << CHARACTER_WIDTH * 5): "G",
-
-    (0b10010 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b11110 << CHARACTER_WIDTH * 2) +
-    (0b10010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b10010 << CHARACTER_WIDTH * 5): "H",
-
-    (0b01110 << CHARACTER_WIDTH * 0) +
-    (0b00100 << CHARACTER_WIDTH * 1) +
-    (0b00100 << CHARACTER_WIDTH * 2) +
-    (0b00100 << CHARACTER_WIDTH * 3) +
-    (0b00100 << CHARACTER_WIDTH * 4) +
-    (0b01110 << CHARACTER_WIDTH * 5): "I",
-
-    (0b00110 << CHARACTER_WIDTH * 0) +
-    (0b00010 << CHARACTER_WIDTH * 1) +
-    (0b00010 << CHARACTER_WIDTH * 2) +
-    (0b00010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b01100 << CHARACTER_WIDTH * 5): "J",
-
-    (0b10010 << CHARACTER_WIDTH * 0) +
-    (0b10100 << CHARACTER_WIDTH * 1) +
-    (0b11000 << CHARACTER_WIDTH * 2) +
-    (0b10100 << CHARACTER_WIDTH * 3) +
-    (0b10100 << CHARACTER_WIDTH * 4) +
-    (0b10010 << CHARACTER_WIDTH * 5): "K",
-
-    (0b10000 << CHARACTER_WIDTH * 0) +
-    (0b10000 << CHARACTER_WIDTH * 1) +
-    (0b10000 << CHARACTER_WIDTH * 2) +
-    (0b10000 << CHARACTER_WIDTH * 3) +
-    (0b10000 << CHARACTER_WIDTH * 4) +
-    (0b11110 << CHARACTER_WIDTH * 5): "L",
-
-    (0b01100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b10010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b01100 << CHARACTER_WIDTH * 5): "O",
-
-    (0b11100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b11100 << CHARACTER_WIDTH * 3) +
-    (0b10000 << CHARACTER_WIDTH * 4) +
-    (0b10000 << CHARACTER_WIDTH * 5): "P",
-
-    (0b11100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b11100 << CHARACTER_WIDTH * 3) +
-    (0b10100 << CHARACTER_WIDTH * 4) +
-    (0b10010 << CHARACTER_WIDTH * 5): "R",
-
-    (0b01110 << CHARACTER_WIDTH * 0) +
-    (0b10000 << CHARACTER_WIDTH * 1) +
-    (0b10000 << CHARACTER_WIDTH * 2) +
-    (0b01100 << CHARACTER_WIDTH * 3) +
-    (0b00010 << CHARACTER_WIDTH * 4) +
-    (0b11100 << CHARACTER_WIDTH * 5): "S",
-
-    (0b10010 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b10010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b01100 << CHARACTER_WIDTH * 5): "U",
-
-    (0b10001 << CHARACTER_WIDTH * 0) +
-    (0b10001 << CHARACTER_WIDTH * 1) +
-    (0b01010 << CHARACTER_WIDTH * 2) +
-    (0b00100 << CHARACTER_WIDTH * 3) +
-    (0b00100 << CHARACTER_WIDTH * 4) +
-    (0b00100 << CHARACTER_WIDTH * 5): "Y",
-
-    (0b11110 << CHARACTER_WIDTH * 0) +
-    (0b00010 << CHARACTER_WIDTH * 1) +
-    (0b00100 << CHARACTER_WIDTH * 2) +
-    (0b01000 << CHARACTER_WIDTH * 3) +
-    (0b10000 << CHARACTER_WIDTH * 4) +
-    (0b11110 << CHARACTER_WIDTH * 5): "Z"
-}
 
 
 def get_image_layers(pixels: List[int]) -> List[List[int]]:
@@ -168,9 +35,9 @@ WHITE = 1
 TRANSPARENT = 2
 
 
-def print_image(image: Dict[complex, int]):
+def print_image(image: List[int]):
     for y, x in product(range(IMAGE_HEIGHT), range(IMAGE_WIDTH)):
-        pixel = image[x + y * 1j]
+        pixel = image[x + y * IMAGE_WIDTH]
         if pixel == WHITE:
             print("#", end="")
         else:
@@ -179,25 +46,10 @@ def print_image(image: Dict[complex, int]):
             print()
 
 
-def get_character_in_image(image: Dict[complex, int], index: int, width: int, height: int) -> str:
-    screen_value = sum(2**(width - 1 - x) << (y * width)
-                       for y, x in product(range(height), range(width))
-                       if image[(width * index + x) + y * 1j] == WHITE)
-    return LETTERS[screen_value]
-
-
 def part2(layers: List[List[int]]) -> str:
-    image = {x + y*1j: TRANSPARENT for x,
-             y in product(range(IMAGE_WIDTH), range(IMAGE_HEIGHT))}
-    for layer in layers:
-        for x, y in product(range(IMAGE_WIDTH), range(IMAGE_HEIGHT)):
-            if image[x + y * 1j] < 2:
-                continue
-            image[x + y * 1j] = layer[x + y * IMAGE_WIDTH]
-    return "".join(map(lambda index:
-                       get_character_in_image(
-                           image, index, CHARACTER_WIDTH, IMAGE_HEIGHT),
-                       range(IMAGE_WIDTH // CHARACTER_WIDTH)))
+    image = [next((pixel for pixel in pixels if pixel != TRANSPARENT), TRANSPARENT) for pixels in zip(*layers)]
+    return read_bitmap([pack_row(pixel == WHITE for pixel in image[y * IMAGE_WIDTH:(y + 1) * IMAGE_WIDTH])
+                        for y in range(IMAGE_HEIGHT)])
 
 
 def solve(pixels: List[int]) -> Tuple[int, str]:
@@ -6,95 +6,63 @@ import time
 from typing import List, Tuple
 import re
 import math
-from copy import deepcopy
 from itertools import combinations
 from functools import reduce
 
 Coordinates = Tuple[int, int, int]
 
+STEPS = 1000
 
-class Moon():
-    def __init__(self, x: int, y: int, z: int):
-        self.position: Coordinates = (x, y, z)
-        self.velocity: Coordinates = (0, 0, 0)
-
-    @staticmethod
-    def get_delta(this_value: int, other_value: int) -> int:
-        if this_value < other_value:
-            return 1
-        if this_value > other_value:
-            return -1
-        return 0
-
-    def get_moon_elta(self, other_moon: Coordinates) -> Coordinates:
-        return (
-            Moon.get_delta(self.position[0], other_moon[0]),
-            Moon.get_delta(self.position[1], other_moon[1]),
-            Moon.get_delta(self.position[2], other_moon[2])
-        )
-
-    @staticmethod
-    def sum(one: Coordinates, two: Coordinates) -> Coordinates:
-        return (one[0] + two[0], one[1] + two[1], one[2] + two[2])
-    
-    @staticmethod
-    def sum_abs(coordinate: Coordinates) -> int:
-        return abs(coordinate[0]) + abs(coordinate[1]) + abs(coordinate[2])
-
-    def update_velocity(self, other_moon: Coordinates):
-        self.velocity = Moon.sum(self.velocity, self.get_moon_elta(other_moon))
-
-    def update_position(self):
-        self.position = Moon.sum(self.position, self.velocity)
-
-    def get_total_energy(self) -> int:
-        return Moon.sum_abs(self.position) * Moon.sum_abs(self.velocity)
-
-    def __str__(self):
-        return f"{self.position} {self.velocity}"
-
-    def __repr__(self) -> str:
-        return self.__str__()
-
-
-def run_step(moons: List[Moon]):
-    for moon_a, moon_b in combinations(moons, 2):
-        moon_a.update_velocity(moon_b.position)
-        moon_b.update_velocity(moon_a.position)
-    for moon in moons:
-        moon.update_position()
-
-
-def part1(moons: List[Moon]) -> int:
-    step = 1000
-    moons = deepcopy(moons)
-    while step:
-        step -= 1
-        run_step(moons)
-    return sum(map(lambda moon: moon.get_total_energy(), moons))
-
-
-def build_state_for_coordinate(coordinate: int, moons: List[Moon]) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
-    return (tuple(moon.position[coordinate] for moon in moons), tuple(moon.velocity[coordinate] for moon in moons))
-
-
-def part2(moons: List[Moon]) -> int:
-    step = 0
-    initial_states = [build_state_for_coordinate(
-        coordinate, moons) for coordinate in range(3)]
-    cyles = [0] * 3
-    while not all(cyles):
-        step += 1
-        run_step(moons)
-        for coordinate in range(3):
-            if not cyles[coordinate]:
-                current_state = build_state_for_coordinate(coordinate, moons)
-                if current_state == initial_states[coordinate]:
-                    cyles[coordinate] = step
-    return reduce(lambda soFar, cycle: soFar * cycle // math.gcd(soFar, cycle), cyles)
-
-
-def solve(moons: List[Moon]) -> Tuple[int, int]:
+
+def run_axis(positions: List[int], velocities: List[int], steps: int = -1) -> int:
+    # Axes never affect each other, so each one is simulated on its own. Without a step count it
+    # runs until every velocity is 0 again; returns the steps run
+    pairs = list(combinations(range(len(positions)), 2))
+    bodies = range(len(positions))
+    done = 0
+    while done != steps:
+        for a, b in pairs:
+            if positions[a] < positions[b]:
+                velocities[a] += 1
+                velocities[b] -= 1
+            elif positions[a] > positions[b]:
+                velocities[a] -= 1
+                velocities[b] += 1
+        for body in bodies:
+            positions[body] += velocities[body]
+        done += 1
+        if steps < 0 and not any(velocities):
+            break
+    return done
+
+
+def get_axis_period(initial_positions: List[int]) -> int:
+    # Steps are reversible and start with every velocity at 0, so once every velocity is back
+    # to 0 the axis retraces its path and is back at the start after twice as many steps
+    positions = list(initial_positions)
+    steps = run_axis(positions, [0] * len(positions))
+    return steps if positions == initial_positions else 2 * steps
+
+
+def get_axes(moons: List[Coordinates]) -> List[List[int]]:
+    return [list(axis) for axis in zip(*moons)]
+
+
+def part1(moons: List[Coordinates]) -> int:
+    positions = get_axes(moons)
+    velocities = [[0] * len(moons) for _ in positions]
+    for axis_positions, axis_velocities in zip(positions, velocities):
+        run_axis(axis_positions, axis_velocities, STEPS)
+    return sum(sum(map(abs, moon_positions)) * sum(map(abs, moon_velocities))
+               for moon_positions, moon_velocities in zip(zip(*positions), zip(*velocities)))
+
+
+def part2(moons: List[Coordinates]) -> int:
+    cycles = [get_axis_period(axis) for axis in get_axes(moons)]
+    return reduce(lambda soFar, cycle: soFar * cycle // math.gcd(soFar, cycle), cycles)
+
+
+def solve(moons: List[Coordinates]) -> Tuple[int, int]:
     return (
         part1(moons),
         part2(moons)
@@ -105,14 +73,14 @@ line_regex = re.compile(
     r"^<x=(?P<x>-?\d+),\sy=(?P<y>-?\d+),\sz=(?P<z>-?\d+)>$")
 
 
-def parse_line(line: str) -> Moon:
+def parse_line(line: str) -> Coordinates:
     match = line_regex.match(line)
     if match:
-        return Moon(int(match.group("x")), int(match.group("y")), int(match.group("z")))
+        return int(match.group("x")), int(match.group("y")), int(match.group("z"))
     raise Exception("Bad format", line)
 
 
-def get_input(file_path: str) -> List[Moon]:
+def get_input(file_path: str) -> List[Coordinates]:
     if not os.path.isfile(file_path):
         raise FileNotFoundError(file_path)
 
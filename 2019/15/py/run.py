@@ -4,7 +4,8 @@ import sys
 import os
 import time
 from typing import Dict, List, Tuple
-from collections import defaultdict
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "lib", "py"))
+from intcode import IntCodeComputer
 
 Position = complex
 DIRECTIONS: Dict[int, Position] = {
@@ -15,111 +16,6 @@ DIRECTIONS: Dict[int, Position] = {
 }
 
 
-class IntCodeComputer():
-    def __init__(self, memory: List[int], inputs: List[int] = []):
-        self.memory = defaultdict(int, [(index, value)
-                                        for index, value in enumerate(memory)])
-        self.pointer = 0
-        self.inputs = inputs
-        self.outputs: List[int] = []
-        self.base = 0
-        self.running = True
-        self.polling = False
-        self.outputing = False
-
-    def set_input(self, value: int):
-        self.inputs.insert(0, value)
-
-    def run(self) -> List[int]:
-        while self.running:
-            self.tick()
-        return self.outputs
-
-    def get_parameter(self, offset: int, mode: int) -> int:
-        value = self.memory[self.pointer + offset]
-        if mode == 0:  # POSITION
-            return self.memory[value]
-        if mode == 1:  # IMMEDIATE
-            return value
-        elif mode == 2:  # RELATIVE
-            return self.memory[self.base + value]
-        raise Exception("Unrecognized parameter mode", mode)
-
-    def get_address(self, offset: int, mode: int) -> int:
-        value = self.memory[self.pointer + offset]
-        if mode == 0:  # POSITION
-            return value
-        if mode == 2:  # RELATIVE
-            return self.base + value
-        raise Exception("Unrecognized address mode", mode)
-
-    def get_output(self) -> int:
-        self.outputing = False
-        return self.outputs.pop()
-
-    def add_input(self, value: int):
-        self.inputs.append(value)
-
-    def tick(self):
-        instruction = self.memory[self.pointer]
-        opcode, p1_mode, p2_mode, p3_mode = instruction % 100, (
-            instruction // 100) % 10, (instruction // 1000) % 10, (instruction // 10000) % 10
-        if not self.running:
-            return
-        if opcode == 1:  # ADD
-            self.memory[self.get_address(3, p3_mode)] = self.get_parameter(
-                1, p1_mode) + self.get_parameter(2, p2_mode)
-            self.pointer += 4
-        elif opcode == 2:  # MUL
-            self.memory[self.get_address(3, p3_mode)] = self.get_parameter(
-                1, p1_mode) * self.get_parameter(2, p2_mode)
-            self.pointer += 4
-        elif opcode == 3:  # INPUT
-            if self.inputs:
-                self.polling = False
-                self.memory[self.get_address(1, p1_mode)] = self.inputs.pop(0)
-                self.pointer += 2
-            else:
-                self.polling = True
-        elif opcode == 4:  # OUTPUT
-            self.outputing = True
-            self.outputs.append(self.get_parameter(1, p1_mode))
-            self.pointer += 2
-        elif opcode == 5:  # JMP_TRUE
-            if self.get_parameter(1, p1_mode):
-                self.pointer = self.get_parameter(2, p2_mode)
-            else:
-                self.pointer += 3
-        elif opcode == 6:  # JMP_FALSE
-            if not self.get_parameter(1, p1_mode):
-                self.pointer = self.get_parameter(2, p2_mode)
-            else:
-                self.pointer += 3
-        elif opcode == 7:  # LESS_THAN
-            self.memory[self.get_address(3, p3_mode)] = 1 if self.get_parameter(
-                1, p1_mode) < self.get_parameter(2, p2_mode) else 0
-            self.pointer += 4
-        elif opcode == 8:  # EQUALS
-            self.memory[self.get_address(3, p3_mode)] = 1 if self.get_parameter(
-                1, p1_mode) == self.get_parameter(2, p2_mode) else 0
-            self.pointer += 4
-        elif opcode == 9:  # SET_BASE
-            self.base += self.get_parameter(1, p1_mode)
-            self.pointer += 2
-        elif opcode == 99:  # HALT
-            self.running = False
-        else:
-            raise Exception(f"Unknown instruction", self.pointer,
-                            instruction, opcode, p1_mode, p2_mode, p3_mode)
-
-    def clone(self):
-        clone_computer = IntCodeComputer([])
-        clone_computer.memory = dict(self.memory)
-        clone_computer.pointer = self.pointer
-        clone_computer.base = self.base
-        return clone_computer
-
-
 def draw_area(oxygen: List[Position], walls: List[Position], open_spaces: List[Position]):
     all_posiitons = walls + oxygen
     min_x = int(min(map(lambda p: p.real, all_posiitons)))
@@ -154,19 +50,15 @@ def run_until_oxygen_system(memory: List[int]) -> Tuple[int, Position, List[Posi
             new_position = position + direction
             if new_position not in visited:
                 visited.append(new_position)
-                new_droid = droid.clone()
-                new_droid.inputs.append(command)
-                while not new_droid.outputing:
-                    new_droid.tick()
-                status = new_droid.get_output()
+                new_droid = droid.fork()
+                new_droid.add_input(command)
+                status = new_droid.run_until_output()
                 if status == 2:  # Oxygen system
                     if steps_to_oxygen_system == 0:
                         steps_to_oxygen_system = len(path)
                     oxygen_position = new_position
                 elif status == 1:  # Open space
                     open_spaces.append(new_position)
-                    while not new_droid.polling:
-                        new_droid.tick()
                     new_path = list(path)
                     new_path.append(new_position)
                     queue.append((new_position, new_path, new_droid))
@@ -4,40 +4,107 @@ import sys
 import os
 import time
 from typing import List, Tuple
+from itertools import accumulate
+from math import comb
 
 
-PATTERN = [0, 1, 0, -1]
+PHASES = 100
+REPEATS = 10000
+MESSAGE_LENGTH = 8
+OFFSET_LENGTH = 7
 
 
-def get_value(offset: int, signal: List[int]) -> int:
-    total = 0
-    for index, number in enumerate(signal):
-        total += number * PATTERN[((index + 1) // offset) % len(PATTERN)]
-    return abs(total) % 10
+def run_phase(signal: List[int]) -> List[int]:
+    # Output digit k adds the signal over runs of k digits starting at k - 1, 5k - 1, ... and
+    # subtracts the runs starting at 3k - 1, 7k - 1, ...; each run is a difference of prefix sums
+    size = len(signal)
+    prefix = [0, *accumulate(signal)]
+    result: List[int] = []
+    for period in range(1, size + 1):
+        total = 0
+        for start in range(period - 1, size, 4 * period):
+            total += prefix[min(start + period, size)] - prefix[start]
+        for start in range(3 * period - 1, size, 4 * period):
+            total -= prefix[min(start + period, size)] - prefix[start]
+        result.append(abs(total) % 10)
+    return result
 
 
-def next_phase(signal: List[int]) -> List[int]:
-    result: List[int] = []
-    for index in range(len(signal)):
-        result.append(get_value(index + 1, signal))
+def run_phases_from(signal: List[int], offset: int, phases: int) -> List[int]:
+    # From the second half on, the pattern is 0 before each digit and 1 from it to the end,
+    # so every phase is a suffix sum of the digits from the offset
+    if 2 * offset < len(signal):
+        for _ in range(phases):
+            signal = run_phase(signal)
+        return signal[offset:]
+    reversed_tail = signal[offset:][::-1]
+    for _ in range(phases):
+        reversed_tail = [total % 10 for total in accumulate(reversed_tail)]
+    return reversed_tail[::-1]
+
+
+def binomial_mod(n: int, k: int, prime: int) -> int:
+    # Lucas' theorem: multiply the binomials of the base prime digits
+    result = 1
+    while n or k:
+        n, n_digit = divmod(n, prime)
+        k, k_digit = divmod(k, prime)
+        if k_digit > n_digit:
+            return 0
+        result = result * comb(n_digit, k_digit) % prime
     return result
 
 
+def get_tail_coefficients(phases: int) -> Tuple[int, List[Tuple[int, int]]]:
+    # After the phases, a second half digit is the sum of the digits j places after it times
+    # C(j + phases - 1, phases - 1) mod 10. Mod 2 and mod 5 those repeat every power above
+    # phases - 1, so one period is enough; only the non zero ones are kept
+    power_of_two, power_of_five = 1, 1
+    while power_of_two < phases:
+        power_of_two *= 2
+    while power_of_five < phases:
+        power_of_five *= 5
+    period = power_of_two * power_of_five
+    coefficients: List[Tuple[int, int]] = []
+    for distance in range(period):
+        n = distance + phases - 1
+        coefficient = (5 * binomial_mod(n, phases - 1, 2) + 6 * binomial_mod(n, phases - 1, 5)) % 10
+        if coefficient:
+            coefficients.append((distance, coefficient))
+    return period, coefficients
+
+
+def get_tail_message(signal: List[int], repeats: int, offset: int, phases: int) -> List[int]:
+    # Only the message digits are computed, reading the repeated signal by index
+    size = len(signal)
+    total_size = size * repeats
+    period, coefficients = get_tail_coefficients(phases)
+    message: List[int] = []
+    for position in range(offset, min(offset + MESSAGE_LENGTH, total_size)):
+        total = 0
+        for period_start in range(0, total_size - position, period):
+            for distance, coefficient in coefficients:
+                index = position + period_start + distance
+                if index >= total_size:
+                    break
+                total += coefficient * signal[index % size]
+        message.append(total % 10)
+    return message
+
+
+def get_message(digits: List[int]) -> str:
+    return "".join(map(str, digits[:MESSAGE_LENGTH]))
+
+
 def part1(signal: List[int]) -> str:
-    signal = list(signal)
-    for _ in range(100):
-        signal = next_phase(signal)
-    return "".join([str(n) for n in signal[:8]])
+    return get_message(run_phases_from(signal, 0, PHASES))
 
 
 def part2(signal: List[int]) -> str:
-    offset = int("".join(map(str, signal[:7])))
-    signal = (signal*10000)[offset:]
-    for _ in range(100):
-        sum = 0
-        for i in range(len(signal)-1, -1, -1):
-            signal[i] = sum = (sum + signal[i]) % 10
-    return "".join(map(str, signal[:8]))
+    offset = int("".join(map(str, signal[:OFFSET_LENGTH])))
+    if 2 * offset < len(signal) * REPEATS:
+        return get_message(run_phases_from(signal * REPEATS, offset, PHASES))
+    return get_message(get_tail_message(signal, REPEATS, offset, PHASES))
 
 
 def solve(signal: List[int]) -> Tuple[str, str]:
@@ -3,62 +3,77 @@
 import sys
 import os
 import time
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 Shuffle = Tuple[int, int]
 NEW_STACK, CUT, INCREMENT = 0, 1, 2
 
 
-def do_shuffles(cards: List[int], shuffles: List[Shuffle]) -> List[int]:
-    cards_count = len(cards)
-    replacement = [0] * cards_count
-    for shuffle, count in shuffles:
-        if shuffle == NEW_STACK:
-            cards = cards[::-1]
-        elif shuffle == CUT:
-            cards = cards[count:] + cards[:count]
-        else:
-            for index in range(cards_count):
-                replacement[(index * count) % cards_count] = cards.pop(0)
-            cards = replacement
-    return cards
-
-
-def inverse_modulo(a: int, n: int) -> int:
-    return pow(a, n-2, n)
+class AffineShuffle():
+    # Moves the card at position p to position (a * p + b) % size; every shuffle has this shape
+    def __init__(self, size: int, a: int = 1, b: int = 0):
+        self.size = size
+        self.a = a % size
+        self.b = b % size
+
+    @staticmethod
+    def compile(shuffles: List[Shuffle], size: int) -> "AffineShuffle":
+        result = AffineShuffle(size)
+        for shuffle, count in shuffles:
+            if shuffle == NEW_STACK:
+                step = AffineShuffle(size, -1, -1)
+            elif shuffle == CUT:
+                step = AffineShuffle(size, 1, -count)
+            else:
+                step = AffineShuffle(size, count, 0)
+            result = result.then(step)
+        return result
+
+    def then(self, other: "AffineShuffle") -> "AffineShuffle":
+        return AffineShuffle(self.size, other.a * self.a, other.a * self.b + other.b)
+
+    def inverse(self) -> "AffineShuffle":
+        a = pow(self.a, -1, self.size)
+        return AffineShuffle(self.size, a, -a * self.b)
+
+    def power(self, times: int) -> "AffineShuffle":
+        # Exponentiation by squaring; negative times undo the shuffle
+        base = self if times >= 0 else self.inverse()
+        times = abs(times)
+        result = AffineShuffle(self.size)
+        while times:
+            if times & 1:
+                result = result.then(base)
+            base = base.then(base)
+            times >>= 1
+        return result
+
+    def get_position(self, card: int) -> int:
+        # Where the card starting at that position ends
+        return (self.a * card + self.b) % self.size
+
+    def get_card(self, position: int) -> int:
+        # Which card ends at that position
+        return (position - self.b) * pow(self.a, -1, self.size) % self.size
+
+    def get_positions(self, cards: Iterable[int]) -> List[int]:
+        return [(self.a * card + self.b) % self.size for card in cards]
+
+    def get_cards(self, positions: Iterable[int]) -> List[int]:
+        return self.inverse().get_positions(positions)
 
 
+CARDS1 = 10007
+POSITION1 = 2019
 CARDS2 = 119315717514047
 RUNS = 101741582076661
 POSITION2 = 2020
 
 
-def part2(shuffles: List[Shuffle]) -> int:
-    la = lb = 0
-    a, b = 1, 0
-    for shuffle, count in shuffles:
-        if shuffle == NEW_STACK:
-            la, lb = -1, -1
-        elif shuffle == INCREMENT:
-            la, lb = count, 0
-        else:
-            la, lb = 1, -count
-        a = (la * a) % CARDS2
-        b = (la * b + lb) % CARDS2
-    Ma = pow(a, RUNS, CARDS2)
-    Mb = (b * (Ma - 1) * inverse_modulo(a - 1, CARDS2)) % CARDS2
-    return ((POSITION2 - Mb) * inverse_modulo(Ma, CARDS2)) % CARDS2
-
-
-CARDS1 = 10007
-POSITION1 = 2019
-
-
 def solve(shuffles: List[Shuffle]) -> Tuple[int, int]:
     return (
-        do_shuffles([card for card in range(CARDS1)],
-                    shuffles).index(POSITION1),
-        part2(shuffles)
+        AffineShuffle.compile(shuffles, CARDS1).get_position(POSITION1),
+        AffineShuffle.compile(shuffles, CARDS2).power(RUNS).get_card(POSITION2)
     )
 
 
@@ -3,157 +3,80 @@
 import sys
 import os
 import time
-from typing import List, Tuple
-from collections import defaultdict
-
-
-class IntCodeComputer():
-    def __init__(self, memory: List[int], inputs: List[int] = [], default_input: bool = False, default_value: int = -1):
-        self.memory = defaultdict(int, [(index, value)
-                                        for index, value in enumerate(memory)])
-        self.pointer = 0
-        self.inputs = inputs
-        self.outputs: List[int] = []
-        self.base = 0
-        self.running = True
-        self.polling = False
-        self.outputing = False
-        self.default_input = default_input
-        self.default_value = default_value
-
-    def set_input(self, value: int):
-        self.inputs.insert(0, value)
-
-    def run(self) -> List[int]:
-        while self.running:
-            self.tick()
-        return self.outputs
-
-    def get_parameter(self, offset: int, mode: int) -> int:
-        value = self.memory[self.pointer + offset]
-        if mode == 0:  # POSITION
-            return self.memory[value]
-        if mode == 1:  # IMMEDIATE
-            return value
-        elif mode == 2:  # RELATIVE
-            return self.memory[self.base + value]
-        raise Exception("Unrecognized parameter mode", mode)
-
-    def get_address(self, offset: int, mode: int) -> int:
-        value = self.memory[self.pointer + offset]
-        if mode == 0:  # POSITION
-            return value
-        if mode == 2:  # RELATIVE
-            return self.base + value
-        raise Exception("Unrecognized address mode", mode)
-
-    def get_output(self) -> int:
-        self.outputing = False
-        return self.outputs.pop()
-
-    def add_input(self, value: int):
-        self.inputs.append(value)
-
-    def tick(self):
-        instruction = self.memory[self.pointer]
-        opcode, p1_mode, p2_mode, p3_mode = instruction % 100, (
-            instruction // 100) % 10, (instruction // 1000) % 10, (instruction // 10000) % 10
-        if not self.running:
-            return
-        if opcode == 1:  # ADD
-            self.memory[self.get_address(3, p3_mode)] = self.get_parameter(
-                1, p1_mode) + self.get_parameter(2, p2_mode)
-            self.pointer += 4
-        elif opcode == 2:  # MUL
-            self.memory[self.get_address(3, p3_mode)] = self.get_parameter(
-                1, p1_mode) * self.get_parameter(2, p2_mode)
-            self.pointer += 4
-        elif opcode == 3:  # INPUT
-            if self.inputs:
-                self.polling = False
-                self.memory[self.get_address(1, p1_mode)] = self.inputs.pop(0)
-                self.pointer += 2
-            elif self.default_input:
-                self.memory[self.get_address(1, p1_mode)] = self.default_value
-                self.pointer += 2
-                self.polling = True
+from typing import Iterator, List, Optional, Tuple
+from collections import deque
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "lib", "py"))
+from intcode import IntCodeComputer
+
+
+Packet = Tuple[int, int, int]
+NAT_ADDRESS = 255
+
+
+class Network():
+    def __init__(self, memory: List[int], size: int = 50):
+        self.computers = [IntCodeComputer(memory, [address]) for address in range(size)]
+        self.ready = deque(range(size))
+        self.scheduled = [True] * size
+
+    def send(self, address: int, x: int, y: int):
+        self.computers[address].add_inputs((x, y))
+        if not self.scheduled[address]:
+            self.scheduled[address] = True
+            self.ready.append(address)
+
+    def route(self, computer: IntCodeComputer) -> Iterator[Packet]:
+        outputs = computer.outputs
+        while len(outputs) >= 3:
+            address, x, y = outputs.popleft(), outputs.popleft(), outputs.popleft()
+            if address < len(self.computers):
+                self.send(address, x, y)
             else:
-                self.polling = True
-        elif opcode == 4:  # OUTPUT
-            self.outputing = True
-            self.outputs.append(self.get_parameter(1, p1_mode))
-            self.pointer += 2
-        elif opcode == 5:  # JMP_TRUE
-            if self.get_parameter(1, p1_mode):
-                self.pointer = self.get_parameter(2, p2_mode)
-            else:
-                self.pointer += 3
-        elif opcode == 6:  # JMP_FALSE
-            if not self.get_parameter(1, p1_mode):
-                self.pointer = self.get_parameter(2, p2_mode)
-            else:
-                self.pointer += 3
-        elif opcode == 7:  # LESS_THAN
-            self.memory[self.get_address(3, p3_mode)] = 1 if self.get_parameter(
-                1, p1_mode) < self.get_parameter(2, p2_mode) else 0
-            self.pointer += 4
-        elif opcode == 8:  # EQUALS
-            self.memory[self.get_address(3, p3_mode)] = 1 if self.get_parameter(
-                1, p1_mode) == self.get_parameter(2, p2_mode) else 0
-            self.pointer += 4
-        elif opcode == 9:  # SET_BASE
-            self.base += self.get_parameter(1, p1_mode)
-            self.pointer += 2
-        elif opcode == 99:  # HALT
-            self.running = False
-        else:
-            raise Exception(f"Unknown instruction", self.pointer,
-                            instruction, opcode, p1_mode, p2_mode, p3_mode)
+                yield address, x, y
+
+    def run_until_idle(self) -> Iterator[Packet]:
+        # Yields packets addressed outside the network; returns once every computer
+        # is waiting for input with nothing queued and no packet is in flight
+        computers = self.computers
+        while True:
+            while self.ready:
+                address = self.ready.popleft()
+                self.scheduled[address] = False
+                computer = computers[address]
+                computer.run_until_input()
+                yield from self.route(computer)
+            sent = False
+            for computer in computers:
+                if not computer.inputs:
+                    computer.add_input(-1)
+                computer.run_until_input()
+                sent = sent or len(computer.outputs) >= 3
+                yield from self.route(computer)
+            if not sent and not self.ready:
+                return
 
 
 def part1(memory: List[int]) -> int:
-    network = [IntCodeComputer(memory, [address]) for address in range(50)]
-    while True:
-        for computer in network:
-            computer.tick()
-            if computer.outputing:
-                if len(computer.outputs) == 3:
-                    y = computer.get_output()
-                    x = computer.get_output()
-                    address = computer.get_output()
-                    if address == 255:
-                        return y
-                    network[address].inputs += [x, y]
-            elif computer.polling and len(computer.inputs) == 0:
-                computer.inputs.append(-1)
+    for address, _, y in Network(memory).run_until_idle():
+        if address == NAT_ADDRESS:
+            return y
+    raise Exception("No packet sent to NAT")
 
 
 def part2(memory: List[int]) -> int:
-    network = [IntCodeComputer(memory, [address], True, -1)
-               for address in range(50)]
-    sent_ys: List[int] = []
-    nat_packet = (0, 0)
+    network = Network(memory)
+    nat_packet: Optional[Tuple[int, int]] = None
+    last_y: Optional[int] = None
     while True:
-        for computer in network:
-            computer.tick()
-            if computer.outputing:
-                if len(computer.outputs) == 3:
-                    y = computer.get_output()
-                    x = computer.get_output()
-                    address = computer.get_output()
-                    if address == 255:
-                        nat_packet = (x, y)
-                    else:
-                        network[address].inputs += [x, y]
-        if all(computer.polling for computer in network):
-            for computer in network:
-                computer.polling = False
-                computer.inputs.clear()
-            if sent_ys and nat_packet[1] == sent_ys[-1]:
-                return nat_packet[1]
-            else:
-                sent_ys.append(nat_packet[1])
-            network[0].inputs += list(nat_packet)
+        for address, x, y in network.run_until_idle():
+            if address == NAT_ADDRESS:
+                nat_packet = (x, y)
+        if nat_packet is None:
+            raise Exception("Network idle without NAT packet")
+        if nat_packet[1] == last_y:
+            return last_y
+        last_y = nat_packet[1]
+        network.send(0, *nat_packet)
 
 
 def solve(memory: List[int]) -> Tuple[int, int]:
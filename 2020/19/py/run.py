@@ -5,7 +5,7 @@ import os
 import time
 import re
 from enum import Enum
-from typing import Dict, List, Tuple
+from typing import Dict, List, Set, Tuple
 
 
 class RuleType(Enum):
@@ -30,35 +30,80 @@ class Rule():
                     list(map(lambda rule: int(rule), set.strip().split(" "))))
 
 
-def find_matched_indexes(rules: Dict[int, Rule], string: str, rule_number: int = 0, index: int = 0) -> List[int]:
-    if index == len(string):
-        return []
-    rule = rules[rule_number]
-    if rule.type == RuleType.Letter:
-        if string[index] == rule.letter:
-            return [index + 1]
-        return []
-    matches: List[int] = []
-    for rule_set in rule.sets:
-        sub_matches = [index]
-        for sub_rule in rule_set:
-            new_matches: List[int] = []
-            for sub_match_index in sub_matches:
-                new_matches += find_matched_indexes(rules, string, sub_rule, sub_match_index)
-            sub_matches = new_matches
-        matches += sub_matches
-    return matches
+class RuleCompiler():
+    # Compiles a rule into a single regular expression. A rule that refers to itself must have the
+    # shape "base | before self after", matching before{n} base after{n}; when both before and
+    # after are there, n is bounded by the longest message
+    def __init__(self, rules: Dict[int, Rule], max_length: int):
+        self.rules = rules
+        self.max_length = max_length
+        self.patterns: Dict[int, str] = {}
+        self.min_lengths: Dict[int, int] = {}
+        self.compiling: Set[int] = set()
+
+    def get_min_length(self, rule_number: int) -> int:
+        if rule_number not in self.min_lengths:
+            rule = self.rules[rule_number]
+            if rule.type == RuleType.Letter:
+                self.min_lengths[rule_number] = 1
+            else:
+                self.min_lengths[rule_number] = min(
+                    sum(self.get_min_length(sub_rule) for sub_rule in rule_set)
+                    for rule_set in rule.sets if rule_number not in rule_set)
+        return self.min_lengths[rule_number]
+
+    def compile_sequence(self, rule_set: List[int]) -> str:
+        return "".join(self.compile(sub_rule) for sub_rule in rule_set)
+
+    def compile(self, rule_number: int) -> str:
+        if rule_number in self.patterns:
+            return self.patterns[rule_number]
+        if rule_number in self.compiling:
+            raise Exception("Unsupported recursive rule", rule_number)
+        self.compiling.add(rule_number)
+        rule = self.rules[rule_number]
+        if rule.type == RuleType.Letter:
+            pattern = rule.letter
+        else:
+            recursive = [rule_set for rule_set in rule.sets if rule_number in rule_set]
+            base = "(?:" + "|".join(self.compile_sequence(rule_set)
+                                    for rule_set in rule.sets if rule_number not in rule_set) + ")"
+            if not recursive:
+                pattern = base
+            elif len(recursive) == 1 and recursive[0].count(rule_number) == 1:
+                position = recursive[0].index(rule_number)
+                before = self.compile_sequence(recursive[0][:position])
+                after = self.compile_sequence(recursive[0][position + 1:])
+                if not after:
+                    pattern = f"(?:{before})*{base}"
+                elif not before:
+                    pattern = f"{base}(?:{after})*"
+                else:
+                    step_length = sum(self.get_min_length(sub_rule) for sub_rule in recursive[0] if sub_rule != rule_number)
+                    depth = max(0, (self.max_length - self.get_min_length(rule_number)) // step_length)
+                    pattern = "(?:" + "|".join(f"(?:{before}){{{n}}}{base}(?:{after}){{{n}}}"
+                                               for n in range(depth + 1)) + ")"
+            else:
+                raise Exception("Unsupported recursive rule", rule_number)
+        self.compiling.remove(rule_number)
+        self.patterns[rule_number] = pattern
+        return pattern
+
+
+def count_matches(rules: Dict[int, Rule], messages: List[str]) -> int:
+    compiler = RuleCompiler(rules, max(map(len, messages), default=0))
+    pattern = re.compile(compiler.compile(0))
+    return sum(1 for message in messages if pattern.fullmatch(message))
 
 
 def solve(puzzle_input: Tuple[Dict[int, Rule], List[str]]) -> Tuple[int, int]:
     rules, messages = puzzle_input
-    part1_result = sum(1 for message in messages if len(
-        message) in find_matched_indexes(rules, message))
+    part1_result = count_matches(rules, messages)
     rules[8] = Rule("42 | 42 8")
     rules[11] = Rule("42 31 | 42 11 31")
     return (
         part1_result,
-        sum(1 for message in messages if len(message) in find_matched_indexes(rules, message))
+        count_matches(rules, messages)
     )
 
 
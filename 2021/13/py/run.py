@@ -1,149 +1,12 @@
 #! /usr/bin/python3
 
 import sys, os, time
-from typing import Tuple, List, Dict
-from itertools import product
+from typing import Tuple, List
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "lib", "py"))
+from ocr import read_points
 
 Input = Tuple[List[complex],List[Tuple[str,int]]]
 
-CHARACTER_WIDTH = 5
-SCREEN_WIDTH = 40
-SCREEN_HEIGHT = 6
-LETTERS: Dict[int, str] = {
-    (0b01100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b11110 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b10010 << CHARACTER_WIDTH * 5): "A",
-
-    (0b11100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b11100 << CHARACTER_WIDTH * 2) +
-    (0b10010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b11100 << CHARACTER_WIDTH * 5): "B",
-
-    (0b01100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10000 << CHARACTER_WIDTH * 2) +
-    (0b10000 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b01100 << CHARACTER_WIDTH * 5): "C",
-
-    (0b11100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b10010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b11100 << CHARACTER_WIDTH * 5): "D",
-
-    (0b11110 << CHARACTER_WIDTH * 0) +
-    (0b10000 << CHARACTER_WIDTH * 1) +
-    (0b11100 << CHARACTER_WIDTH * 2) +
-    (0b10000 << CHARACTER_WIDTH * 3) +
-    (0b10000 << CHARACTER_WIDTH * 4) +
-    (0b11110 << CHARACTER_WIDTH * 5): "E",
-
-    (0b11110 << CHARACTER_WIDTH * 0) +
-    (0b10000 << CHARACTER_WIDTH * 1) +
-    (0b11100 << CHARACTER_WIDTH * 2) +
-    (0b10000 << CHARACTER_WIDTH * 3) +
-    (0b10000 << CHARACTER_WIDTH * 4) +
-    (0b10000 << CHARACTER_WIDTH * 5): "F",
-
-    (0b01100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10000 << CHARACTER_WIDTH * 2) +
-    (0b10110 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b01110 << CHARACTER_WIDTH * 5): "G",
-
-    (0b10010 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b11110 << CHARACTER_WIDTH * 2) +
-    (0b10010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b10010 << CHARACTER_WIDTH * 5): "H",
-
-    (0b01110 << CHARACTER_WIDTH * 0) +
-    (0b00100 << CHARACTER_WIDTH * 1) +
-    (0b00100 << CHARACTER_WIDTH * 2) +
-    (0b00100 << CHARACTER_WIDTH * 3) +
-    (0b00100 << CHARACTER_WIDTH * 4) +
-    (0b01110 << CHARACTER_WIDTH * 5): "I",
-
-    (0b00110 << CHARACTER_WIDTH * 0) +
-    (0b00010 << CHARACTER_WIDTH * 1) +
-    (0b00010 << CHARACTER_WIDTH * 2) +
-    (0b00010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b01100 << CHARACTER_WIDTH * 5): "J",
-
-    (0b10010 << CHARACTER_WIDTH * 0) +
-    (0b10100 << CHARACTER_WIDTH * 1) +
-    (0b11000 << CHARACTER_WIDTH * 2) +
-    (0b10100 << CHARACTER_WIDTH * 3) +
-    (0b10100 << CHARACTER_WIDTH * 4) +
-    (0b10010 << CHARACTER_WIDTH * 5): "K",
-
-    (0b10000 << CHARACTER_WIDTH * 0) +
-    (0b10000 << CHARACTER_WIDTH * 1) +
-    (0b10000 << CHARACTER_WIDTH * 2) +
-    (0b10000 << CHARACTER_WIDTH * 3) +
-    (0b10000 << CHARACTER_WIDTH * 4) +
-    (0b11110 << CHARACTER_WIDTH * 5): "L",
-
-    (0b01100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b10010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b01100 << CHARACTER_WIDTH * 5): "O",
-
-    (0b11100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b11100 << CHARACTER_WIDTH * 3) +
-    (0b10000 << CHARACTER_WIDTH * 4) +
-    (0b10000 << CHARACTER_WIDTH * 5): "P",
-
-    (0b11100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b11100 << CHARACTER_WIDTH * 3) +
-    (0b10100 << CHARACTER_WIDTH * 4) +
-    (0b10010 << CHARACTER_WIDTH * 5): "R",
-
-    (0b01110 << CHARACTER_WIDTH * 0) +
-    (0b10000 << CHARACTER_WIDTH * 1) +
-    (0b10000 << CHARACTER_WIDTH * 2) +
-    (0b01100 << CHARACTER_WIDTH * 3) +
-    (0b00010 << CHARACTER_WIDTH * 4) +
-    (0b11100 << CHARACTER_WIDTH * 5): "S",
-
-    (0b10010 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b10010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b01100 << CHARACTER_WIDTH * 5): "U",
-
-    (0b10001 << CHARACTER_WIDTH * 0) +
-    (0b10001 << CHARACTER_WIDTH * 1) +
-    (0b01010 << CHARACTER_WIDTH * 2) +
-    (0b00100 << CHARACTER_WIDTH * 3) +
-    (0b00100 << CHARACTER_WIDTH * 4) +
-    (0b00100 << CHARACTER_WIDTH * 5): "Y",
-
-    (0b11110 << CHARACTER_WIDTH * 0) +
-    (0b00010 << CHARACTER_WIDTH * 1) +
-    (0b00100 << CHARACTER_WIDTH * 2) +
-    (0b01000 << CHARACTER_WIDTH * 3) +
-    (0b10000 << CHARACTER_WIDTH * 4) +
-    (0b11110 << CHARACTER_WIDTH * 5): "Z"
-}
-
 
 def fold_paper(paper: List[complex], folding: Tuple[str,int]) -> List[complex]:
     direction, coordinate = folding
@@ -159,13 +22,6 @@ def fold_paper(paper: List[complex], folding: Tuple[str,int]) -> List[complex]:
     return list(set(new_paper))
 
 
-def get_character_in_paper(paper: List[complex], index: int, width: int, height: int) -> str:
-    paper_value = sum(2**(width - 1 - x) << (y * width)
-                       for y, x in product(range(height), range(width))
-                       if (width * index + x) + y * 1j in paper)
-    return LETTERS[paper_value]
-
-
 def solve(puzzle_input: Input) -> Tuple[int,int]:
     points, foldings = puzzle_input
     part1 = 0
@@ -175,9 +31,7 @@ def solve(puzzle_input: Input) -> Tuple[int,int]:
             part1 = len(points)
     return (
         part1,
-        "".join(map(lambda index:
-                    get_character_in_paper(points, index,
-                                            CHARACTER_WIDTH, SCREEN_HEIGHT), range(SCREEN_WIDTH // CHARACTER_WIDTH)))
+        read_points(((int(point.real), int(point.imag)) for point in points), (0, 0))
     )
 
 
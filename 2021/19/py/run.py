@@ -1,49 +1,90 @@
 #! /usr/bin/python3
 
 import sys, os, time
-from typing import Tuple, List, Set
-from itertools import product
-from collections import Counter
+from typing import Dict, Tuple, List, Optional, Set
+from itertools import combinations, product
+from collections import Counter, defaultdict
 
 Beacon = Tuple[int, int, int]
 Scanner = List[Beacon]
 Input = List[Scanner]
 
 
+Fingerprint = Dict[int, List[Tuple[int, int]]]
+# Per output dimension: source dimension, its sign and the offset to subtract
+Transform = List[Tuple[int, int, int]]
+
+OVERLAP = 12
+OVERLAP_PAIRS = OVERLAP * (OVERLAP - 1) // 2
+
+
+def get_fingerprint(scanner: Scanner) -> Fingerprint:
+    # Pairs of beacons by squared distance, which no rotation or translation changes
+    fingerprint: Fingerprint = defaultdict(list)
+    for (index_a, (xa, ya, za)), (index_b, (xb, yb, zb)) in combinations(enumerate(scanner), 2):
+        fingerprint[(xa - xb) ** 2 + (ya - yb) ** 2 + (za - zb) ** 2].append((index_a, index_b))
+    return fingerprint
+
+
+def get_matching_beacons(fingerprint: Fingerprint, other: Fingerprint) -> Tuple[List[int], List[int]]:
+    # Beacons in the overlap of two scanners take part in OVERLAP - 1 pairs whose distance both scanners see
+    shared = fingerprint.keys() & other.keys()
+    if sum(min(len(fingerprint[distance]), len(other[distance])) for distance in shared) < OVERLAP_PAIRS:
+        return [], []
+    counts: Counter = Counter()
+    other_counts: Counter = Counter()
+    for distance in shared:
+        for pair in fingerprint[distance]:
+            counts.update(pair)
+        for pair in other[distance]:
+            other_counts.update(pair)
+    return [index for index, count in counts.items() if count >= OVERLAP - 1], \
+        [index for index, count in other_counts.items() if count >= OVERLAP - 1]
+
+
 TEST_SPACE = [(0,1),(1,1),(2,1),(0,-1),(1,-1),(2,-1)]
-def try_overlap(known: Scanner, candidate: Scanner) -> Tuple[bool, Scanner, Beacon]:
-    new_beacons_differences: List[List[int]] = []
-    offset_list: List[int] = []
+def try_overlap(known: Scanner, candidate: Scanner) -> Optional[Transform]:
+    transform: Transform = []
     for dimension in range(3):
         known_positions = [beacon[dimension] for beacon in known]
         for (test_dimension, test_offset) in TEST_SPACE:
             candidate_positions = [beacon[test_dimension] * test_offset for beacon in candidate]
             differences = [candidate_position - known_position for (known_position , candidate_position) in product(known_positions, candidate_positions)]
             (difference, occurrences) = Counter(differences).most_common(1)[0]
-            if occurrences >= 12:
+            if occurrences >= OVERLAP:
                 break
-        if occurrences < 12:
-            return False, [], (0, 0, 0)
-        new_beacons_differences.append([candidate_position - difference for candidate_position in candidate_positions])
-        offset_list.append(difference)
-    return True, list(zip(new_beacons_differences[0],new_beacons_differences[1],new_beacons_differences[2])), tuple(offset_list)
+        if occurrences < OVERLAP:
+            return None
+        transform.append((test_dimension, test_offset, difference))
+    return transform
+
+
+def apply_transform(scanner: Scanner, transform: Transform) -> Scanner:
+    return [tuple(beacon[test_dimension] * test_offset - difference for test_dimension, test_offset, difference in transform)
+            for beacon in scanner]
 
 
 def solve(scanners: Input) -> Tuple[int, int]:
+    fingerprints = [get_fingerprint(scanner) for scanner in scanners]
     known_beacons: Set[Beacon] = set()
-    queue: List[Scanner] = [ scanners[0] ]
-    scanners_left = scanners[1:]
+    queue: List[Tuple[int, Scanner]] = [ (0, scanners[0]) ]
+    scanners_left = list(range(1, len(scanners)))
     offsets: List[Beacon] = [(0,0,0)]
     while queue:
-        aligned = queue.pop()
-        still_left: List[Scanner] = []
-        for candidate in scanners_left:
-            success, offset_beacons, offset = try_overlap(aligned, candidate)
-            if success:
-                offsets.append(offset)
-                queue.append(offset_beacons)
+        aligned_index, aligned = queue.pop()
+        still_left: List[int] = []
+        for candidate_index in scanners_left:
+            # Only scanners sharing enough beacon distances go through the offset voting
+            known_matches, candidate_matches = get_matching_beacons(fingerprints[aligned_index], fingerprints[candidate_index])
+            transform = None
+            if len(known_matches) >= OVERLAP and len(candidate_matches) >= OVERLAP:
+                transform = try_overlap([aligned[index] for index in known_matches],
+                                        [scanners[candidate_index][index] for index in candidate_matches])
+            if transform:
+                offsets.append(tuple(difference for _, _, difference in transform))
+                queue.append((candidate_index, apply_transform(scanners[candidate_index], transform)))
             else:
-                still_left.append(candidate)
+                still_left.append(candidate_index)
         scanners_left = still_left
         known_beacons.update(aligned)
     return len(known_beacons), max(sum(abs(a-b) for (a,b) in zip(left,right)) for left,right in product(offsets,offsets))
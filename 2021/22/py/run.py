@@ -1,7 +1,9 @@
 #! /usr/bin/python3
 
 import sys, os, time
-from typing import Tuple, List, Dict
+from typing import Callable, Dict, List, Tuple
+from collections import Counter
+from itertools import compress
 import re
 
 Ranges = List[Tuple[int, int]]
@@ -25,6 +27,13 @@ def is_empty(ranges: Ranges) -> bool:
     return ranges[0] == (0, 0) or ranges[1] == (0, 0) or ranges[2] == (0, 0)
 
 
+def get_volume(ranges: Ranges) -> int:
+    result = 1
+    for (start, end) in ranges:
+        result *= end - start
+    return result
+
+
 class Cube:
     def __init__(self, ranges: Ranges) -> None:
         self.ranges = ranges
@@ -41,20 +50,12 @@ class Cube:
 
 
     def get_volume(self) -> int:
-        result = 1
-        for (start, end) in self.ranges:
-            result *= end - start
-        return result - sum(inner_cube.get_volume() for inner_cube in self.inner_cubes)
+        return get_volume(self.ranges) - sum(inner_cube.get_volume() for inner_cube in self.inner_cubes)
 
 
-def get_on_count(instructions: Input, limits: Ranges) -> int:
-    result = 0
+def get_excluded_volume(instructions: Input) -> int:
     cubes: List[Cube] = []
     for (turn_on, ranges) in instructions:
-        if limits:
-            ranges = subtract(ranges, limits)
-        if is_empty(ranges):
-            continue
         cube = Cube(ranges)
         for previous_cube in cubes:
             previous_cube.exclude(ranges)
@@ -63,6 +64,73 @@ def get_on_count(instructions: Input, limits: Ranges) -> int:
     return sum(cube.get_volume() for cube in cubes)
 
 
+def get_signed_volume(instructions: Input) -> int:
+    # Inclusion-exclusion: each cuboid's overlap with a new one is added back with the opposite
+    # sign, and cuboids whose signs cancel out are dropped
+    cuboids: Counter = Counter()
+    for (turn_on, ranges) in instructions:
+        (x_start, x_end), (y_start, y_end), (z_start, z_end) = ranges
+        update: Counter = Counter()
+        for cuboid, sign in cuboids.items():
+            other_x_start, other_x_end, other_y_start, other_y_end, other_z_start, other_z_end = cuboid
+            if other_x_start >= x_end or x_start >= other_x_end \
+                    or other_y_start >= y_end or y_start >= other_y_end \
+                    or other_z_start >= z_end or z_start >= other_z_end:
+                continue
+            update[(max(x_start, other_x_start), min(x_end, other_x_end),
+                    max(y_start, other_y_start), min(y_end, other_y_end),
+                    max(z_start, other_z_start), min(z_end, other_z_end))] -= sign
+        if turn_on:
+            update[(x_start, x_end, y_start, y_end, z_start, z_end)] += 1
+        for cuboid, sign in update.items():
+            sign += cuboids[cuboid]
+            if sign:
+                cuboids[cuboid] = sign
+            else:
+                del cuboids[cuboid]
+    return sum(sign * (x_end - x_start) * (y_end - y_start) * (z_end - z_start)
+               for (x_start, x_end, y_start, y_end, z_start, z_end), sign in cuboids.items())
+
+
+def get_compressed_volume(instructions: Input) -> int:
+    # One cell per span between consecutive cuboid bounds, so the grid grows with the cube of
+    # the instruction count: only meant for small inputs
+    bounds = [sorted({bound for _, ranges in instructions for bound in ranges[dimension]}) for dimension in range(3)]
+    indexes = [{bound: index for index, bound in enumerate(dimension_bounds)} for dimension_bounds in bounds]
+    widths = [[end - start for start, end in zip(dimension_bounds, dimension_bounds[1:])] for dimension_bounds in bounds]
+    x_count, y_count, z_count = (len(dimension_widths) for dimension_widths in widths)
+    grid = bytearray(x_count * y_count * z_count)
+    for (turn_on, ranges) in instructions:
+        (x_start, x_end), (y_start, y_end), (z_start, z_end) = (
+            (dimension_indexes[start], dimension_indexes[end])
+            for dimension_indexes, (start, end) in zip(indexes, ranges))
+        values = bytes([turn_on]) * (z_end - z_start)
+        for x in range(x_start, x_end):
+            for y in range(y_start, y_end):
+                row = (x * y_count + y) * z_count
+                grid[row + z_start:row + z_end] = values
+    result = 0
+    for x, width in enumerate(widths[0]):
+        for y, height in enumerate(widths[1]):
+            row = (x * y_count + y) * z_count
+            result += width * height * sum(compress(widths[2], grid[row:row + z_count]))
+    return result
+
+
+ENGINES: Dict[str, Callable[[Input], int]] = {
+    "exclusion": get_excluded_volume,
+    "signed": get_signed_volume,
+    "compressed": get_compressed_volume
+}
+
+
+def get_on_count(instructions: Input, limits: Ranges, engine: str = "signed") -> int:
+    if limits:
+        instructions = [(turn_on, subtract(ranges, limits)) for (turn_on, ranges) in instructions]
+    instructions = [(turn_on, ranges) for (turn_on, ranges) in instructions if not is_empty(ranges)]
+    return ENGINES[engine](instructions)
+
+
 def solve(instructions: Input) -> Tuple[int,int]:
     return (get_on_count(instructions, ((-50, 51), (-50, 51), (-50, 51))), get_on_count(instructions, None))
 
@@ -1,147 +1,14 @@
 #! /usr/bin/python3
 
 import sys, os, time
-from typing import Tuple, List, Dict
+from typing import Tuple, List
 from enum import Enum
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "lib", "py"))
+from ocr import read_bitmap
 
 
-CHARACTER_WIDTH = 5
-CHARACTER_HEIGHT = 6
 SCREEN_WIDTH = 40
-LETTERS: Dict[int, str] = {
-    (0b01100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b11110 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b10010 << CHARACTER_WIDTH * 5): "A",
-
-    (0b11100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b11100 << CHARACTER_WIDTH * 2) +
-    (0b10010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b11100 << CHARACTER_WIDTH * 5): "B",
-
-    (0b01100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10000 << CHARACTER_WIDTH * 2) +
-    (0b10000 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b01100 << CHARACTER_WIDTH * 5): "C",
-
-    (0b11100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b10010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b11100 << CHARACTER_WIDTH * 5): "D",
-
-    (0b11110 << CHARACTER_WIDTH * 0) +
-    (0b10000 << CHARACTER_WIDTH * 1) +
-    (0b11100 << CHARACTER_WIDTH * 2) +
-    (0b10000 << CHARACTER_WIDTH * 3) +
-    (0b10000 << CHARACTER_WIDTH * 4) +
-    (0b11110 << CHARACTER_WIDTH * 5): "E",
-
-    (0b11110 << CHARACTER_WIDTH * 0) +
-    (0b10000 << CHARACTER_WIDTH * 1) +
-    (0b11100 << CHARACTER_WIDTH * 2) +
-    (0b10000 << CHARACTER_WIDTH * 3) +
-    (0b10000 << CHARACTER_WIDTH * 4) +
-    (0b10000 << CHARACTER_WIDTH * 5): "F",
-
-    (0b01100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10000 << CHARACTER_WIDTH * 2) +
-    (0b10110 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b01110 << CHARACTER_WIDTH * 5): "G",
-
-    (0b10010 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b11110 << CHARACTER_WIDTH * 2) +
-    (0b10010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b10010 << CHARACTER_WIDTH * 5): "H",
-
-    (0b01110 << CHARACTER_WIDTH * 0) +
-    (0b00100 << CHARACTER_WIDTH * 1) +
-    (0b00100 << CHARACTER_WIDTH * 2) +
-    (0b00100 << CHARACTER_WIDTH * 3) +
-    (0b00100 << CHARACTER_WIDTH * 4) +
-    (0b01110 << CHARACTER_WIDTH * 5): "I",
-
-    (0b00110 << CHARACTER_WIDTH * 0) +
-    (0b00010 << CHARACTER_WIDTH * 1) +
-    (0b00010 << CHARACTER_WIDTH * 2) +
-    (0b00010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b01100 << CHARACTER_WIDTH * 5): "J",
-
-    (0b10010 << CHARACTER_WIDTH * 0) +
-    (0b10100 << CHARACTER_WIDTH * 1) +
-    (0b11000 << CHARACTER_WIDTH * 2) +
-    (0b10100 << CHARACTER_WIDTH * 3) +
-    (0b10100 << CHARACTER_WIDTH * 4) +
-    (0b10010 << CHARACTER_WIDTH * 5): "K",
-
-    (0b10000 << CHARACTER_WIDTH * 0) +
-    (0b10000 << CHARACTER_WIDTH * 1) +
-    (0b10000 << CHARACTER_WIDTH * 2) +
-    (0b10000 << CHARACTER_WIDTH * 3) +
-    (0b10000 << CHARACTER_WIDTH * 4) +
-    (0b11110 << CHARACTER_WIDTH * 5): "L",
-
-    (0b01100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b10010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b01100 << CHARACTER_WIDTH * 5): "O",
-
-    (0b11100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b11100 << CHARACTER_WIDTH * 3) +
-    (0b10000 << CHARACTER_WIDTH * 4) +
-    (0b10000 << CHARACTER_WIDTH * 5): "P",
-
-    (0b11100 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b11100 << CHARACTER_WIDTH * 3) +
-    (0b10100 << CHARACTER_WIDTH * 4) +
-    (0b10010 << CHARACTER_WIDTH * 5): "R",
-
-    (0b01110 << CHARACTER_WIDTH * 0) +
-    (0b10000 << CHARACTER_WIDTH * 1) +
-    (0b10000 << CHARACTER_WIDTH * 2) +
-    (0b01100 << CHARACTER_WIDTH * 3) +
-    (0b00010 << CHARACTER_WIDTH * 4) +
-    (0b11100 << CHARACTER_WIDTH * 5): "S",
-
-    (0b10010 << CHARACTER_WIDTH * 0) +
-    (0b10010 << CHARACTER_WIDTH * 1) +
-    (0b10010 << CHARACTER_WIDTH * 2) +
-    (0b10010 << CHARACTER_WIDTH * 3) +
-    (0b10010 << CHARACTER_WIDTH * 4) +
-    (0b01100 << CHARACTER_WIDTH * 5): "U",
-
-    (0b10001 << CHARACTER_WIDTH * 0) +
-    (0b10001 << CHARACTER_WIDTH * 1) +
-    (0b01010 << CHARACTER_WIDTH * 2) +
-    (0b00100 << CHARACTER_WIDTH * 3) +
-    (0b00100 << CHARACTER_WIDTH * 4) +
-    (0b00100 << CHARACTER_WIDTH * 5): "Y",
-
-    (0b11110 << CHARACTER_WIDTH * 0) +
-    (0b00010 << CHARACTER_WIDTH * 1) +
-    (0b00100 << CHARACTER_WIDTH * 2) +
-    (0b01000 << CHARACTER_WIDTH * 3) +
-    (0b10000 << CHARACTER_WIDTH * 4) +
-    (0b11110 << CHARACTER_WIDTH * 5): "Z"
-}
+SCREEN_HEIGHT = 6
 
 class OpCode(Enum):
     Addx = 0
@@ -165,24 +32,18 @@ def part1(instructions: Input) -> int:
     return strengths_sum
 
 
-def get_letter_in_crt(crt: List[str], index: int, width: int, height: int) -> str:
-    screen_value = sum(2**(width - 1 - x) << (y * width)
-                      for y in range(height) for x in range(width)
-                      if x < width - 1 and crt[(width * index + x) + y * SCREEN_WIDTH] == "#")
-    return LETTERS[screen_value]
-
-
 def part2(instructions: Input) -> str:
-    crt = [ "." ] * SCREEN_WIDTH * 6
+    crt = [ 0 ] * SCREEN_HEIGHT
     cycle = 0
     register_x = 1
     for opCode, value in instructions:
         for _ in range(1 if opCode == OpCode.Noop else 2):
+            row, column = divmod(cycle, SCREEN_WIDTH)
+            if register_x - 1 <= column <= register_x + 1:
+                crt[row] |= 1 << column
             cycle += 1
-            if register_x <= cycle % SCREEN_WIDTH <= register_x + 2:
-                crt[cycle - 1] = "#"
         register_x += value
-    return "".join(map(lambda index: get_letter_in_crt(crt, index, CHARACTER_WIDTH, CHARACTER_HEIGHT), range((SCREEN_WIDTH // CHARACTER_WIDTH))))
+    return read_bitmap(crt)
 
 
 def solve(puzzle_input: Input) -> Tuple[int,str]:
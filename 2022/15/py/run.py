@@ -1,40 +1,119 @@
 #! /usr/bin/python3
 
 import sys, os, time
-from typing import Tuple, List
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from itertools import product
+import heapq
 
 Input = List[Tuple[int, int, int, int]]
 
 
+Sensor = Tuple[int, int, int]
+Interval = Tuple[int, int]
+
+ROW = 2_000_000  # 10 for example input
+BOUND = 4_000_000  # 20 for example input
+TUNING_MULTIPLIER = 4_000_000
+
+
 def get_manhatan_distance(x1: int, y1: int, x2: int, y2: int) -> int:
     return abs(x1 - x2) + abs(y1 - y2)
 
 
-def part1(data: List[Tuple[int, int, int]]) -> int:
-    LINE = 2_000_000  # 10 for example input
-    return max(x - abs(LINE - y) + distance for x, y, distance in data) - \
-        min(x + abs(LINE - y) - distance for x, y, distance in data)
-
-
-def part2(data: List[Tuple[int, int, int]]) -> int:
-    MIN = 0
-    MAX = 4_000_000  # 20 for example input
-    for xa, ya, da in data:
-        for xb, yb, db in data:
-            cross_distance_a = xa - ya - da
-            cross_distance_b = xb + yb + db
-            beacon_x = (cross_distance_b + cross_distance_a) // 2
-            beacon_y = (cross_distance_b - cross_distance_a) // 2 + 1
-            if MIN < beacon_x < MAX and MIN < beacon_y <= MAX \
-                    and all(get_manhatan_distance(beacon_x, beacon_y, x, y) > distance for x, y, distance in data):
-                return 4_000_000 * beacon_x + beacon_y
+def merge_intervals(intervals: List[Interval]) -> List[Interval]:
+    # Sorted, disjoint, non adjacent inclusive intervals covering the same cells
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def sweep_rows(sensors: List[Sensor], rows: Iterable[int]) -> Iterator[Tuple[int, List[Interval]]]:
+    # Rows must come in increasing order. Sensors join the active set on the first row they reach
+    # and leave it after the last one, so each is added and removed once; every row still merges
+    # the intervals of the sensors active on it
+    starting = sorted(sensors, key=lambda sensor: sensor[1] - sensor[2])
+    next_sensor = 0
+    active: List[Tuple[int, Sensor]] = []
+    for row in rows:
+        while next_sensor < len(starting) and starting[next_sensor][1] - starting[next_sensor][2] <= row:
+            sensor = starting[next_sensor]
+            heapq.heappush(active, (sensor[1] + sensor[2], sensor))
+            next_sensor += 1
+        while active and active[0][0] < row:
+            heapq.heappop(active)
+        intervals = []
+        for _, (x, y, distance) in active:
+            width = distance - abs(row - y)
+            intervals.append((x - width, x + width))
+        yield row, merge_intervals(intervals)
+
+
+def get_row_coverage(sensors: List[Sensor], rows: Iterable[int]) -> Dict[int, List[Interval]]:
+    return dict(sweep_rows(sensors, sorted(rows)))
+
+
+def part1(sensors: List[Sensor], beacons: Set[Tuple[int, int]], row: int) -> int:
+    intervals = get_row_coverage(sensors, [row])[row]
+    beacons_in_row = sum(1 for x, y in beacons if y == row and any(start <= x <= end for start, end in intervals))
+    return sum(end - start + 1 for start, end in intervals) - beacons_in_row
+
+
+def is_covered(sensors: List[Sensor], x: int, y: int) -> bool:
+    return any(get_manhatan_distance(x, y, sensor_x, sensor_y) <= distance for sensor_x, sensor_y, distance in sensors)
+
+
+def get_candidates(sensors: List[Sensor], bound: int, paired: bool) -> Iterator[Tuple[int, int]]:
+    # In rotated coordinates u = x + y and v = x - y the cells just outside a sensor's range lie on
+    # two u lines and two v lines. A lone uncovered cell sits where a u line and a v line cross;
+    # when paired, only lines that are the outer edge of two sensors one cell apart are used
+    lines: List[Set[int]] = []
+    for rotation in (lambda x, y: x + y, lambda x, y: x - y):
+        lower = {rotation(x, y) - distance - 1 for x, y, distance in sensors}
+        upper = {rotation(x, y) + distance + 1 for x, y, distance in sensors}
+        lines.append(lower & upper if paired else lower | upper)
+    for u, v in product(*lines):
+        if (u + v) % 2 == 0:
+            yield (u + v) // 2, (u - v) // 2
+    if not paired:
+        yield from product((0, bound), repeat=2)
+
+
+def find_gap(sensors: List[Sensor], bound: int) -> Optional[Tuple[int, int]]:
+    # Row by row scan for the first cell inside the area that no interval covers
+    for row, intervals in sweep_rows(sensors, range(bound + 1)):
+        x = 0
+        for start, end in intervals:
+            if start > x:
+                break
+            x = max(x, end + 1)
+        if x <= bound:
+            return x, row
+    return None
+
+
+def part2(sensors: List[Sensor], bound: int) -> int:
+    for paired in (True, False):
+        for x, y in get_candidates(sensors, bound, paired):
+            if 0 <= x <= bound and 0 <= y <= bound and not is_covered(sensors, x, y):
+                return TUNING_MULTIPLIER * x + y
+    # A free cell on a side of the area, or only crossed by parallel boundary lines
+    gap = find_gap(sensors, bound)
+    if gap:
+        x, y = gap
+        return TUNING_MULTIPLIER * x + y
     raise Exception("Beam not found!")
 
 
-def solve(puzzle_input: Input) -> Tuple[int, int]:
-    data: List[Tuple[int, int, int]] = [(sensor_x, sensor_y, get_manhatan_distance(
+def solve(puzzle_input: Input, row: int = ROW, bound: int = BOUND) -> Tuple[int, int]:
+    sensors: List[Sensor] = [(sensor_x, sensor_y, get_manhatan_distance(
         sensor_x, sensor_y, beacon_x, beacon_y)) for sensor_x, sensor_y, beacon_x, beacon_y in puzzle_input]
-    return (part1(data), part2(data))
+    beacons = {(beacon_x, beacon_y) for _, _, beacon_x, beacon_y in puzzle_input}
+    return (part1(sensors, beacons, row), part2(sensors, bound))
 
 
 def get_value(text: str) -> int:
@@ -0,0 +1,165 @@
+from typing import Dict, List, Optional, Tuple
+
+Instruction = Tuple[int, ...]
+
+REGISTERS = "abcd"
+
+NOP = 0
+CPY = 1
+INC = 2
+DEC = 3
+JNZ = 4
+TGL = 5
+OUT = 6
+ADD = 7  # inc x / dec y / jnz y -2  ->  x += y, y = 0
+MUL = 8  # cpy f t / inc x / dec t / jnz t -2 / dec o / jnz o -5  ->  x += f * o, t = 0, o = 0
+
+TOGGLES = {
+    "inc": "dec",
+    "dec": "inc",
+    "tgl": "inc",
+    "out": "inc",
+    "jnz": "cpy",
+    "cpy": "jnz"
+}
+
+
+class AssembunnyComputer():
+    def __init__(self, source: List[List[str]], registers: Dict[str, int] = {}):
+        self.source = [[part.strip() for part in instruction if part.strip()] for instruction in source]
+        # Registers a to d, followed by one read-only slot per immediate value
+        self.registers = [registers.get(register, 0) for register in REGISTERS]
+        self.constants: Dict[int, int] = {}
+        self.plain = [self._compile_plain(index) for index in range(len(self.source))]
+        self.program = [self._compile(index) for index in range(len(self.source))]
+        self.pointer = 0
+        self.outputs: List[int] = []
+
+    def get_register(self, register: str) -> int:
+        return self.registers[REGISTERS.index(register)]
+
+    def _operand(self, parameter: str) -> Optional[int]:
+        if parameter in REGISTERS:
+            return REGISTERS.index(parameter)
+        try:
+            value = int(parameter)
+        except ValueError:
+            return None
+        if value not in self.constants:
+            self.constants[value] = len(self.registers)
+            self.registers.append(value)
+        return self.constants[value]
+
+    def _register(self, parameter: str) -> Optional[int]:
+        return REGISTERS.index(parameter) if parameter in REGISTERS else None
+
+    def _compile_plain(self, index: int) -> Instruction:
+        mnemonic, *parameters = self.source[index]
+        if mnemonic == "cpy":
+            source, target = self._operand(parameters[0]), self._register(parameters[1])
+            if source is not None and target is not None:
+                return (CPY, source, target)
+        elif mnemonic in ("inc", "dec"):
+            register = self._register(parameters[0])
+            if register is not None:
+                return (INC if mnemonic == "inc" else DEC, register)
+        elif mnemonic == "jnz":
+            return (JNZ, self._operand(parameters[0]), self._operand(parameters[1]))
+        elif mnemonic == "tgl":
+            return (TGL, self._operand(parameters[0]))
+        elif mnemonic == "out":
+            return (OUT, self._operand(parameters[0]))
+        return (NOP,)
+
+    def _find_add(self, index: int) -> Optional[Tuple[int, int]]:
+        window = self.plain[index:index + 3]
+        if len(window) < 3:
+            return None
+        first, second, jump = window
+        if first[0] == DEC and second[0] == INC:
+            first, second = second, first
+        if first[0] != INC or second[0] != DEC or jump[0] != JNZ:
+            return None
+        target, counter = first[1], second[1]
+        if target == counter or jump[1] != counter or jump[2] < len(REGISTERS) or self.registers[jump[2]] != -2:
+            return None
+        return target, counter
+
+    def _compile(self, index: int) -> Instruction:
+        add = self._find_add(index)
+        if add:
+            return (ADD, *add)
+        window = self.plain[index:index + 6]
+        if len(window) == 6 and window[0][0] == CPY and self.plain[index + 4][0] == DEC:
+            add = self._find_add(index + 1)
+            jump = window[5]
+            if add:
+                target, counter = add
+                factor, temp = window[0][1], window[0][2]
+                outer = window[4][1]
+                if temp == counter and jump[0] == JNZ and jump[1] == outer \
+                        and jump[2] >= len(REGISTERS) and self.registers[jump[2]] == -5 \
+                        and len({target, temp, outer}) == 3 and factor not in (target, temp, outer):
+                    return (MUL, target, factor, temp, outer)
+        return self.plain[index]
+
+    def toggle(self, index: int):
+        if not 0 <= index < len(self.source):
+            return
+        instruction = self.source[index]
+        instruction[0] = TOGGLES[instruction[0]]
+        self.plain[index] = self._compile_plain(index)
+        # Only patterns starting up to five instructions before can include the toggled one
+        for start in range(max(0, index - 5), index + 1):
+            self.program[start] = self._compile(start)
+
+    def run(self, max_outputs: int = 0) -> Dict[str, int]:
+        registers = self.registers
+        program = self.program
+        plain = self.plain
+        outputs = self.outputs
+        size = len(program)
+        pointer = self.pointer
+        while 0 <= pointer < size:
+            instruction = program[pointer]
+            opcode = instruction[0]
+            if opcode == ADD:
+                _, target, counter = instruction
+                if registers[counter] > 0:
+                    registers[target] += registers[counter]
+                    registers[counter] = 0
+                    pointer += 3
+                    continue
+                instruction = plain[pointer]
+                opcode = instruction[0]
+            elif opcode == MUL:
+                _, target, factor, temp, outer = instruction
+                if registers[factor] > 0 and registers[outer] > 0:
+                    registers[target] += registers[factor] * registers[outer]
+                    registers[temp] = 0
+                    registers[outer] = 0
+                    pointer += 6
+                    continue
+                instruction = plain[pointer]
+                opcode = instruction[0]
+
+            if opcode == CPY:
+                registers[instruction[2]] = registers[instruction[1]]
+            elif opcode == INC:
+                registers[instruction[1]] += 1
+            elif opcode == DEC:
+                registers[instruction[1]] -= 1
+            elif opcode == JNZ:
+                if registers[instruction[1]]:
+                    pointer += registers[instruction[2]]
+                    continue
+            elif opcode == TGL:
+                self.toggle(pointer + registers[instruction[1]])
+            elif opcode == OUT:
+                outputs.append(registers[instruction[1]])
+                if max_outputs and len(outputs) >= max_outputs:
+                    pointer += 1
+                    break
+            pointer += 1
+        self.pointer = pointer
+        return { register: registers[index] for index, register in enumerate(REGISTERS) }
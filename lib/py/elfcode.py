@@ -0,0 +1,249 @@
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+Operation = Tuple[str, int, int, int]
+Registers = List[int]
+Step = Callable[[Registers], None]
+# Applies a loop in closed form and moves the instruction pointer past it;
+# returns False, changing nothing, when the loop cannot be shortcut
+Shortcut = Callable[[Registers], bool]
+
+OPERATIONS: Dict[str, Callable[[Sequence[int], int, int], int]] = {
+    "addr": lambda r, a, b: r[a] + r[b],
+    "addi": lambda r, a, b: r[a] + b,
+    "mulr": lambda r, a, b: r[a] * r[b],
+    "muli": lambda r, a, b: r[a] * b,
+    "banr": lambda r, a, b: r[a] & r[b],
+    "bani": lambda r, a, b: r[a] & b,
+    "borr": lambda r, a, b: r[a] | r[b],
+    "bori": lambda r, a, b: r[a] | b,
+    "setr": lambda r, a, b: r[a],
+    "seti": lambda r, a, b: a,
+    "gtir": lambda r, a, b: 1 if a > r[b] else 0,
+    "gtri": lambda r, a, b: 1 if r[a] > b else 0,
+    "gtrr": lambda r, a, b: 1 if r[a] > r[b] else 0,
+    "eqir": lambda r, a, b: 1 if a == r[b] else 0,
+    "eqri": lambda r, a, b: 1 if r[a] == b else 0,
+    "eqrr": lambda r, a, b: 1 if r[a] == r[b] else 0
+}
+MNEMONICS = list(OPERATIONS)
+
+TEMPLATES = {
+    "addr": "r[{c}] = r[{a}] + r[{b}]",
+    "addi": "r[{c}] = r[{a}] + {b}",
+    "mulr": "r[{c}] = r[{a}] * r[{b}]",
+    "muli": "r[{c}] = r[{a}] * {b}",
+    "banr": "r[{c}] = r[{a}] & r[{b}]",
+    "bani": "r[{c}] = r[{a}] & {b}",
+    "borr": "r[{c}] = r[{a}] | r[{b}]",
+    "bori": "r[{c}] = r[{a}] | {b}",
+    "setr": "r[{c}] = r[{a}]",
+    "seti": "r[{c}] = {a}",
+    "gtir": "r[{c}] = 1 if {a} > r[{b}] else 0",
+    "gtri": "r[{c}] = 1 if r[{a}] > {b} else 0",
+    "gtrr": "r[{c}] = 1 if r[{a}] > r[{b}] else 0",
+    "eqir": "r[{c}] = 1 if {a} == r[{b}] else 0",
+    "eqri": "r[{c}] = 1 if r[{a}] == {b} else 0",
+    "eqrr": "r[{c}] = 1 if r[{a}] == r[{b}] else 0"
+}
+COMMUTATIVE = { "addr", "mulr", "banr", "borr", "eqrr" }
+
+
+def execute(registers: Sequence[int], operation: Operation) -> Registers:
+    mnemonic, a, b, c = operation
+    result = list(registers)
+    result[c] = OPERATIONS[mnemonic](registers, a, b)
+    return result
+
+
+def compile_operation(operation: Operation) -> Step:
+    mnemonic, a, b, c = operation
+    scope: Dict[str, Step] = {}
+    exec(f"def step(r):\n    {TEMPLATES[mnemonic].format(a=a, b=b, c=c)}", scope)
+    return scope["step"]
+
+
+# Loop patterns. Lowercase names bind registers, uppercase names bind values,
+# "ip" is the instruction pointer register and "_" matches anything
+Pattern = List[Tuple[str, Union[str, int], Union[str, int], Union[str, int]]]
+
+# for j in j..n: if i * j == n: acc += i
+MULTIPLE_LOOP: Pattern = [
+    ("mulr", "i", "j", "t"),
+    ("eqrr", "t", "n", "t"),
+    ("addr", "t", "ip", "ip"),
+    ("addi", "ip", 1, "ip"),
+    ("addr", "i", "acc", "acc"),
+    ("addi", "j", 1, "j"),
+    ("gtrr", "j", "n", "t"),
+    ("addr", "ip", "t", "ip"),
+    ("seti", "LOOP", "_", "ip")
+]
+# for i in i..n: (j = 1; MULTIPLE_LOOP), i.e. acc += divisors of n from i up
+DIVISOR_SUM_LOOP: Pattern = [("seti", 1, "_", "j")] + MULTIPLE_LOOP + [
+    ("addi", "i", 1, "i"),
+    ("gtrr", "i", "n", "t"),
+    ("addr", "t", "ip", "ip"),
+    ("seti", "OUTER", "_", "ip")
+]
+# q = smallest q from q up with (q + 1) * K > x, i.e. x // K
+DIVISION_LOOP: Pattern = [
+    ("addi", "q", 1, "t"),
+    ("muli", "t", "K", "t"),
+    ("gtrr", "t", "x", "t"),
+    ("addr", "t", "ip", "ip"),
+    ("addi", "ip", 1, "ip"),
+    ("seti", "EXIT", "_", "ip"),
+    ("addi", "q", 1, "q"),
+    ("seti", "LOOP", "_", "ip")
+]
+
+
+def _bind(name: Union[str, int], value: int, bindings: Dict[str, int]) -> bool:
+    if isinstance(name, int):
+        return name == value
+    if name == "_":
+        return True
+    if name in bindings:
+        return bindings[name] == value
+    if name.islower() and value in (bound for bound_name, bound in bindings.items() if bound_name.islower()):
+        # Different register names must be different registers
+        return False
+    bindings[name] = value
+    return True
+
+
+def _match(pattern: Pattern, operations: List[Operation], start: int, ip: int) -> Optional[Dict[str, int]]:
+    if start + len(pattern) > len(operations):
+        return None
+    bindings = { "ip": ip }
+    for (mnemonic, *names), (operation_mnemonic, a, b, c) in zip(pattern, operations[start:]):
+        if operation_mnemonic != mnemonic:
+            return None
+        orders = [(a, b, c)]
+        if mnemonic in COMMUTATIVE:
+            orders.append((b, a, c))
+        for values in orders:
+            candidate = dict(bindings)
+            if all(_bind(name, value, candidate) for name, value in zip(names, values)):
+                bindings = candidate
+                break
+        else:
+            return None
+    return bindings
+
+
+def _sum_divisors_from(number: int, lowest: int) -> int:
+    total = 0
+    divisor = 1
+    while divisor * divisor <= number:
+        if number % divisor == 0:
+            pair = number // divisor
+            if divisor >= lowest:
+                total += divisor
+            if pair != divisor and pair >= lowest:
+                total += pair
+        divisor += 1
+    return total
+
+
+def _multiple_loop(start: int, b: Dict[str, int]) -> Shortcut:
+    i, j, t, n, acc, ip = b["i"], b["j"], b["t"], b["n"], b["acc"], b["ip"]
+    exit = start + len(MULTIPLE_LOOP)
+
+    def shortcut(r: Registers) -> bool:
+        first, last = r[j], max(r[j], r[n])
+        if r[i]:
+            matches = 1 if r[n] % r[i] == 0 and first <= r[n] // r[i] <= last else 0
+        else:
+            matches = last - first + 1 if r[n] == 0 else 0
+        r[acc] += r[i] * matches
+        r[j] = last + 1
+        r[t] = 1
+        r[ip] = exit
+        return True
+    return shortcut
+
+
+def _divisor_sum_loop(start: int, b: Dict[str, int]) -> Shortcut:
+    i, j, t, n, acc, ip = b["i"], b["j"], b["t"], b["n"], b["acc"], b["ip"]
+    exit = start + len(DIVISOR_SUM_LOOP)
+
+    def shortcut(r: Registers) -> bool:
+        if r[n] < 1 or r[i] < 1:
+            return False
+        r[acc] += _sum_divisors_from(r[n], r[i])
+        r[i] = max(r[i], r[n]) + 1
+        r[j] = r[n] + 1
+        r[t] = 1
+        r[ip] = exit
+        return True
+    return shortcut
+
+
+def _division_loop(start: int, b: Dict[str, int]) -> Shortcut:
+    q, t, x, ip, divisor = b["q"], b["t"], b["x"], b["ip"], b["K"]
+    exit = b["EXIT"] + 1
+
+    def shortcut(r: Registers) -> bool:
+        r[q] = max(r[q], r[x] // divisor)
+        r[t] = 1
+        r[ip] = exit
+        return True
+    return shortcut
+
+
+def find_shortcuts(operations: List[Operation], ip: int) -> Dict[int, Shortcut]:
+    shortcuts: Dict[int, Shortcut] = {}
+    for start in range(len(operations)):
+        bindings = _match(MULTIPLE_LOOP, operations, start, ip)
+        if bindings and bindings["LOOP"] == start - 1:
+            shortcuts[start] = _multiple_loop(start, bindings)
+        bindings = _match(DIVISOR_SUM_LOOP, operations, start, ip)
+        if bindings and bindings["LOOP"] == start and bindings["OUTER"] == start - 1:
+            shortcuts[start] = _divisor_sum_loop(start, bindings)
+        bindings = _match(DIVISION_LOOP, operations, start, ip)
+        if bindings and bindings["LOOP"] == start - 1 and bindings["K"] > 0 \
+                and not start <= bindings["EXIT"] + 1 < start + len(DIVISION_LOOP):
+            shortcuts[start] = _division_loop(start, bindings)
+    return shortcuts
+
+
+class ElfCodeComputer():
+    def __init__(self, operations: List[Operation], ip_register: Optional[int] = None,
+                 registers: Sequence[int] = (0, 0, 0, 0, 0, 0), optimize: bool = True):
+        self.size = len(registers)
+        self.registers = list(registers)
+        if ip_register is None:
+            # Without a bound register the pointer lives in a hidden extra one
+            ip_register = len(self.registers)
+            self.registers.append(0)
+        self.ip = ip_register
+        self.program = [compile_operation(operation) for operation in operations]
+        self.shortcuts: List[Optional[Shortcut]] = [None] * len(operations)
+        if optimize:
+            for index, shortcut in find_shortcuts(operations, ip_register).items():
+                self.shortcuts[index] = shortcut
+
+    @property
+    def running(self) -> bool:
+        return 0 <= self.registers[self.ip] < len(self.program)
+
+    def run(self, breakpoint: int = -1) -> Registers:
+        # Runs until halted or until about to execute the breakpoint instruction again
+        r = self.registers
+        ip = self.ip
+        program = self.program
+        shortcuts = self.shortcuts
+        size = len(program)
+        first = True
+        while 0 <= r[ip] < size:
+            pointer = r[ip]
+            if pointer == breakpoint and not first:
+                break
+            first = False
+            shortcut = shortcuts[pointer]
+            if shortcut and shortcut(r):
+                continue
+            program[pointer](r)
+            r[ip] += 1
+        return r[:self.size]
@@ -0,0 +1,171 @@
+from collections import deque
+from typing import Deque, Iterable, List, Optional, Tuple
+
+Instruction = Tuple[int, int, int, int]
+
+# Reasons _execute returns
+HALTED = 0
+POLLING = 1
+OUTPUT = 2
+STEPPED = 3
+
+
+def decode(value: int) -> Instruction:
+    return value % 100, (value // 100) % 10, (value // 1000) % 10, (value // 10000) % 10
+
+
+class IntCodeComputer():
+    def __init__(self, memory: List[int], inputs: Iterable[int] = ()):
+        self.memory = list(memory)
+        self.decoded: List[Optional[Instruction]] = [None] * len(self.memory)
+        self.shared = False
+        self.pointer = 0
+        self.base = 0
+        self.inputs: Deque[int] = deque(inputs)
+        self.outputs: Deque[int] = deque()
+        self.running = True
+        self.polling = False
+
+    def add_input(self, value: int):
+        self.inputs.append(value)
+
+    def add_inputs(self, values: Iterable[int]):
+        self.inputs.extend(values)
+
+    def get_output(self) -> int:
+        return self.outputs.popleft()
+
+    def run(self) -> Deque[int]:
+        # Runs until halted or waiting for input
+        self._execute(False)
+        return self.outputs
+
+    def run_until_input(self) -> Deque[int]:
+        return self.run()
+
+    def run_until_output(self) -> Optional[int]:
+        if self._execute(True) == OUTPUT:
+            return self.outputs.pop()
+        return None
+
+    def tick(self):
+        self._execute(False, 1)
+
+    def fork(self) -> "IntCodeComputer":
+        # Both computers share memory until either of them runs again
+        forked = IntCodeComputer.__new__(IntCodeComputer)
+        forked.memory = self.memory
+        forked.decoded = self.decoded
+        forked.shared = self.shared = True
+        forked.pointer = self.pointer
+        forked.base = self.base
+        forked.inputs = deque(self.inputs)
+        forked.outputs = deque(self.outputs)
+        forked.running = self.running
+        forked.polling = self.polling
+        return forked
+
+    def grow(self, size: int):
+        self._own_memory()
+        missing = size - len(self.memory)
+        if missing > 0:
+            self.memory.extend([0] * missing)
+            self.decoded.extend([None] * missing)
+
+    def _own_memory(self):
+        if self.shared:
+            self.memory = list(self.memory)
+            self.decoded = list(self.decoded)
+            self.shared = False
+
+    def _execute(self, stop_on_output: bool, steps: int = -1) -> int:
+        if not self.running:
+            return HALTED
+        self._own_memory()
+        while True:
+            try:
+                return self._execute_unchecked(stop_on_output, steps)
+            except IndexError:
+                # Read or write past the end of memory; nothing was changed, so grow and retry
+                self.grow(2 * len(self.memory))
+
+    def _execute_unchecked(self, stop_on_output: bool, steps: int) -> int:
+        memory = self.memory
+        decoded = self.decoded
+        inputs = self.inputs
+        pointer = self.pointer
+        base = self.base
+        try:
+            while steps:
+                steps -= 1
+                instruction = decoded[pointer]
+                if instruction is None:
+                    instruction = decoded[pointer] = decode(memory[pointer])
+                opcode, mode1, mode2, mode3 = instruction
+
+                if opcode == 99:  # HALT
+                    self.running = False
+                    return HALTED
+
+                first = memory[pointer + 1]
+                if mode1 == 0:
+                    value1 = memory[first]
+                elif mode1 == 2:
+                    first += base
+                    value1 = memory[first]
+                else:
+                    value1 = first
+
+                if opcode == 3:  # INPUT
+                    if not inputs:
+                        self.polling = True
+                        return POLLING
+                    self.polling = False
+                    memory[first] = inputs[0]
+                    inputs.popleft()
+                    decoded[first] = None
+                    pointer += 2
+                    continue
+                if opcode == 4:  # OUTPUT
+                    self.outputs.append(value1)
+                    pointer += 2
+                    if stop_on_output:
+                        return OUTPUT
+                    continue
+                if opcode == 9:  # SET_BASE
+                    base += value1
+                    pointer += 2
+                    continue
+
+                value2 = memory[pointer + 2]
+                if mode2 == 0:
+                    value2 = memory[value2]
+                elif mode2 == 2:
+                    value2 = memory[base + value2]
+
+                if opcode == 5:  # JMP_TRUE
+                    pointer = value2 if value1 else pointer + 3
+                    continue
+                if opcode == 6:  # JMP_FALSE
+                    pointer = pointer + 3 if value1 else value2
+                    continue
+
+                address = memory[pointer + 3]
+                if mode3 == 2:
+                    address += base
+                if opcode == 1:  # ADD
+                    memory[address] = value1 + value2
+                elif opcode == 2:  # MUL
+                    memory[address] = value1 * value2
+                elif opcode == 7:  # LESS_THAN
+                    memory[address] = 1 if value1 < value2 else 0
+                elif opcode == 8:  # EQUALS
+                    memory[address] = 1 if value1 == value2 else 0
+                else:
+                    raise Exception("Unknown instruction", pointer, memory[pointer])
+                decoded[address] = None
+                pointer += 4
+            return STEPPED
+        finally:
+            self.pointer = pointer
+            self.base = base
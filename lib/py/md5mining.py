@@ -0,0 +1,79 @@
+import os
+from binascii import hexlify
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import md5
+from itertools import count
+from typing import Callable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+Chunk = Tuple[str, int, int]
+
+CHUNK_SIZE = 1 << 15
+
+
+def _find_in_chunk(chunk: Chunk, zero_nibbles: int) -> List[Tuple[int, bytes]]:
+    prefix, start, end = chunk
+    salted = md5(prefix.encode())
+    half = zero_nibbles >> 1
+    zero_bytes = bytes(half)
+    odd = zero_nibbles & 1
+    found = []
+    for index in range(start, end):
+        hash = salted.copy()
+        hash.update(str(index).encode())
+        digest = hash.digest()
+        if digest.startswith(zero_bytes) and (not odd or digest[half] < 16):
+            found.append((index, digest))
+    return found
+
+
+def _hash_chunk(chunk: Chunk, stretch: int) -> List[bytes]:
+    prefix, start, end = chunk
+    salted = md5(prefix.encode())
+    hashes = []
+    for index in range(start, end):
+        hash = salted.copy()
+        hash.update(str(index).encode())
+        value = hexlify(hash.digest())
+        for _ in range(stretch):
+            value = hexlify(md5(value).digest())
+        hashes.append(value)
+    return hashes
+
+
+def _map_chunks(worker: Callable[[Chunk, int], List[T]], prefix: str, start: int, argument: int,
+                chunk_size: int, processes: Optional[int]) -> Iterator[List[T]]:
+    # Results come back in index order; only a bounded window of chunks is in flight
+    processes = processes or os.cpu_count() or 1
+    chunks = ((prefix, chunk_start, chunk_start + chunk_size) for chunk_start in count(start, chunk_size))
+    if processes == 1:
+        for chunk in chunks:
+            yield worker(chunk, argument)
+        return
+    with ProcessPoolExecutor(processes) as executor:
+        pending = deque(executor.submit(worker, next(chunks), argument) for _ in range(2 * processes))
+        try:
+            while True:
+                result = pending.popleft().result()
+                pending.append(executor.submit(worker, next(chunks), argument))
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def find_hashes(prefix: str, zero_nibbles: int, start: int = 0,
+                chunk_size: int = CHUNK_SIZE, processes: Optional[int] = None) -> Iterator[Tuple[int, bytes]]:
+    # Indexes, in order, whose md5(prefix + index) digest starts with zero_nibbles hex zeros
+    for found in _map_chunks(_find_in_chunk, prefix, start, zero_nibbles, chunk_size, processes):
+        yield from found
+
+
+def generate_hashes(prefix: str, stretch: int = 0, start: int = 0,
+                    chunk_size: int = CHUNK_SIZE, processes: Optional[int] = None) -> Iterator[bytes]:
+    # Hex digests of md5(prefix + index) for consecutive indexes, rehashed stretch more times
+    if stretch:
+        chunk_size = max(1, chunk_size // (stretch + 1))
+    for hashes in _map_chunks(_hash_chunk, prefix, start, stretch, chunk_size, processes):
+        yield from hashes
@@ -0,0 +1,115 @@
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Bitmaps are one int per row, with bit x set when column x is lit
+
+
+def pack_row(pixels: Iterable[bool]) -> int:
+    row = 0
+    for x, lit in enumerate(pixels):
+        if lit:
+            row |= 1 << x
+    return row
+
+
+class Font():
+    def __init__(self, width: int, pitch: int, glyphs: Dict[str, str]):
+        self.width = width
+        self.pitch = pitch
+        self.mask = (1 << width) - 1
+        self.letters: Dict[int, str] = {}
+        self.height = 0
+        for letter, glyph in glyphs.items():
+            rows = [pack_row(pixel == "#" for pixel in row) for row in glyph.split()]
+            self.height = len(rows)
+            self.letters[self.get_key(rows, 0)] = letter
+
+    def get_key(self, rows: Sequence[int], index: int) -> int:
+        shift = index * self.pitch
+        key = 0
+        for y, row in enumerate(rows):
+            key |= ((row >> shift) & self.mask) << (y * self.width)
+        return key
+
+    def read(self, rows: Sequence[int]) -> str:
+        count = (max(row.bit_length() for row in rows) + self.pitch - 1) // self.pitch
+        letters = []
+        for index in range(count):
+            key = self.get_key(rows, index)
+            if key not in self.letters:
+                raise Exception("Unknown glyph", index)
+            letters.append(self.letters[key])
+        return "".join(letters)
+
+
+SMALL_FONT = Font(5, 5, {
+    "A": ".##.. #..#. #..#. ####. #..#. #..#.",
+    "B": "###.. #..#. ###.. #..#. #..#. ###..",
+    "C": ".##.. #..#. #.... #.... #..#. .##..",
+    "D": "###.. #..#. #..#. #..#. #..#. ###..",
+    "E": "####. #.... ###.. #.... #.... ####.",
+    "F": "####. #.... ###.. #.... #.... #....",
+    "G": ".##.. #..#. #.... #.##. #..#. .###.",
+    "H": "#..#. #..#. ####. #..#. #..#. #..#.",
+    "I": ".###. ..#.. ..#.. ..#.. ..#.. .###.",
+    "J": "..##. ...#. ...#. ...#. #..#. .##..",
+    "K": "#..#. #.#.. ##... #.#.. #.#.. #..#.",
+    "L": "#.... #.... #.... #.... #.... ####.",
+    "O": ".##.. #..#. #..#. #..#. #..#. .##..",
+    "P": "###.. #..#. #..#. ###.. #.... #....",
+    "R": "###.. #..#. #..#. ###.. #.#.. #..#.",
+    "S": ".###. #.... #.... .##.. ...#. ###..",
+    "U": "#..#. #..#. #..#. #..#. #..#. .##..",
+    "Y": "#...# #...# .#.#. ..#.. ..#.. ..#..",
+    "Z": "####. ...#. ..#.. .#... #.... ####."
+})
+
+LARGE_FONT = Font(6, 8, {
+    "A": "..##.. .#..#. #....# #....# #....# ###### #....# #....# #....# #....#",
+    "B": "#####. #....# #....# #....# #####. #....# #....# #....# #....# #####.",
+    "C": ".####. #....# #..... #..... #..... #..... #..... #..... #....# .####.",
+    "D": "#####. #....# #....# #....# #....# #....# #....# #....# #....# #####.",
+    "E": "###### #..... #..... #..... #####. #..... #..... #..... #..... ######",
+    "F": "###### #..... #..... #..... #####. #..... #..... #..... #..... #.....",
+    "G": ".####. #....# #..... #..... #..... #..### #....# #....# #...## .###.#",
+    "H": "#....# #....# #....# #....# ###### #....# #....# #....# #....# #....#",
+    "I": "###... .#.... .#.... .#.... .#.... .#.... .#.... .#.... .#.... ###...",  # Not sure
+    "J": "...### ....#. ....#. ....#. ....#. ....#. ....#. #...#. #...#. .###..",
+    "K": "#....# #...#. #..#.. #.#... ##.... ##.... #.#... #..#.. #...#. #....#",
+    "L": "#..... #..... #..... #..... #..... #..... #..... #..... #..... ######",
+    "M": "#....# ##..## ##..## #.##.# #....# #....# #....# #....# #....# #....#",  # Not sure
+    "N": "#....# ##...# ##...# #.#..# #.#..# #..#.# #..#.# #...## #...## #....#",
+    "O": ".####. #....# #....# #....# #....# #....# #....# #....# #....# .####.",
+    "P": "#####. #....# #....# #....# #####. #..... #..... #..... #..... #.....",
+    "Q": ".####. #....# #....# #....# #....# #....# #....# #..#.# #..##. .##..#",  # Not sure
+    "R": "#####. #....# #....# #....# #####. #..#.. #...#. #...#. #....# #....#",
+    "S": ".####. #....# #..... #..... .####. .....# .....# .....# #....# .####.",
+    "T": "#####. ..#... ..#... ..#... ..#... ..#... ..#... ..#... ..#... ..#...",  # Not sure
+    "U": "#....# #....# #....# #....# #....# #....# #....# #....# #....# .####.",
+    "V": "#....# #....# #....# #....# #....# #....# #....# .#..#. .#..#. ..##..",  # Not sure
+    "W": "#....# #....# #....# #....# #....# #....# #.##.# #.##.# ##..## #....#",  # Not sure
+    "X": "#....# #....# .#..#. .#..#. ..##.. ..##.. .#..#. .#..#. #....# #....#",
+    "Y": "#...#. #...#. .#.#.. .#.#.. ..#... ..#... ..#... ..#... ..#... ..#...",  # Not sure
+    "Z": "###### .....# .....# ....#. ...#.. ..#... .#.... #..... #..... ######"
+})
+
+FONTS = [SMALL_FONT, LARGE_FONT]
+
+
+def read_bitmap(rows: Sequence[int]) -> str:
+    # The font is picked by height; shorter bitmaps are padded with blank rows at the bottom
+    for font in FONTS:
+        if len(rows) <= font.height:
+            return font.read(list(rows) + [0] * (font.height - len(rows)))
+    raise Exception("No font is tall enough", len(rows))
+
+
+def read_points(points: Iterable[Tuple[int, int]], origin: Optional[Tuple[int, int]] = None) -> str:
+    # Origin is the top left corner of the text, by default the one of the lit points
+    points = list(points)
+    if origin is None:
+        origin = min(x for x, _ in points), min(y for _, y in points)
+    origin_x, origin_y = origin
+    rows: List[int] = [0] * (max(y for _, y in points) - origin_y + 1)
+    for x, y in points:
+        rows[y - origin_y] |= 1 << (x - origin_x)
+    return read_bitmap(rows)
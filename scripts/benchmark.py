@@ -0,0 +1,157 @@
+#! /usr/bin/python3
+
+import sys, os, time, json, argparse, math, statistics, importlib.util
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INPUTS_DIR = os.path.join(ROOT, "inputs")
+TIMES_FILE = os.path.join(ROOT, "data", "times.json")
+INPUT_SETS = 6
+
+Puzzle = Tuple[int, int]
+
+
+def find_puzzles(selectors: List[str]) -> Iterator[Puzzle]:
+    years = sorted(int(name) for name in os.listdir(ROOT) if name.isdigit())
+    for year in years:
+        for day in range(1, 26):
+            if not os.path.isfile(get_solution_path(year, day)):
+                continue
+            if selectors and not any(is_selected(selector, year, day) for selector in selectors):
+                continue
+            yield year, day
+
+
+def is_selected(selector: str, year: int, day: int) -> bool:
+    parts = selector.strip("/").split("/")
+    if int(parts[0]) != year:
+        return False
+    return len(parts) == 1 or int(parts[1]) == day
+
+
+def get_solution_path(year: int, day: int) -> str:
+    return os.path.join(ROOT, str(year), f"{day:02}", "py", "run.py")
+
+
+def get_input_path(year: int, day: int, input_set: int) -> str:
+    return os.path.join(INPUTS_DIR, str(input_set), f"{year}-{day:02}.txt")
+
+
+def load_solution(year: int, day: int) -> ModuleType:
+    path = get_solution_path(year, day)
+    spec = importlib.util.spec_from_file_location(f"aoc_{year}_{day:02}", path)
+    module = importlib.util.module_from_spec(spec)
+    solution_dir = os.path.dirname(path)
+    sys.path.insert(0, solution_dir)
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(solution_dir)
+    return module
+
+
+def get_entry_points(module: ModuleType) -> Tuple[Callable[[str], Any], Callable[[Any], Tuple[Any, Any]]]:
+    get_input = getattr(module, "get_input", None) or getattr(module, "getInput")
+    return get_input, module.solve
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    # Nearest rank: the smallest sample with at least that fraction of them at or below it
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def measure(module: ModuleType, input_path: str, warmup: int, iterations: int) -> Dict[str, float]:
+    get_input, solve = get_entry_points(module)
+    for _ in range(warmup):
+        solve(get_input(input_path))
+    samples: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        solve(get_input(input_path))
+        samples.append(time.perf_counter() - start)
+    return {
+        "time": statistics.median(samples),
+        "p95": percentile(samples, 0.95),
+        "min": min(samples)
+    }
+
+
+def get_day_entry(times: Dict[str, Any], year: int, day: int) -> Dict[str, Any]:
+    year_entry = next((entry for entry in times["years"] if entry["year"] == year), None)
+    if year_entry is None:
+        year_entry = { "year": year, "days": [] }
+        times["years"].append(year_entry)
+        times["years"].sort(key=lambda entry: entry["year"])
+    day_entry = next((entry for entry in year_entry["days"] if entry["day"] == day), None)
+    if day_entry is None:
+        day_entry = { "day": day, "times": [] }
+        year_entry["days"].append(day_entry)
+        year_entry["days"].sort(key=lambda entry: entry["day"])
+    return day_entry
+
+
+def record(times: Dict[str, Any], year: int, day: int, env: str, input_set: int, result: Dict[str, float]):
+    day_entry = get_day_entry(times, year, day)
+    day_entry["times"] = [entry for entry in day_entry["times"]
+                          if entry["env"] != env or entry.get("input", 0) != input_set]
+    day_entry["times"].append({ "env": env, "input": input_set, **result })
+    day_entry["times"].sort(key=lambda entry: (entry["env"], entry.get("input", 0)))
+
+
+def load_times() -> Dict[str, Any]:
+    with open(TIMES_FILE) as file:
+        return json.load(file)
+
+
+def save_times(times: Dict[str, Any]):
+    with open(TIMES_FILE, "w") as file:
+        json.dump(times, file, indent=4)
+        file.write("\n")
+
+
+def run(env: str, selectors: List[str], input_sets: List[int], warmup: int, iterations: int, dry_run: bool):
+    times = load_times()
+    if env not in (environment["id"] for environment in times["environments"]):
+        raise Exception("Unknown environment", env)
+
+    for year, day in find_puzzles(selectors):
+        try:
+            module = load_solution(year, day)
+        except Exception as error:
+            print(f"{year}/{day:02} load failed: {error!r}")
+            continue
+        for input_set in input_sets:
+            input_path = get_input_path(year, day, input_set)
+            if not os.path.isfile(input_path):
+                continue
+            try:
+                result = measure(module, input_path, warmup, iterations)
+            except Exception as error:
+                print(f"{year}/{day:02} input{input_set} failed: {error!r}")
+                continue
+            print(f"{year}/{day:02} input{input_set} median {result['time']:.7f} p95 {result['p95']:.7f} min {result['min']:.7f}")
+            record(times, year, day, env, input_set, result)
+        if not dry_run:
+            save_times(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time Python solutions in-process and record results in data/times.json")
+    parser.add_argument("env", help="environment id from data/times.json")
+    parser.add_argument("puzzles", nargs="*", help="YEAR or YEAR/DAY selectors (default: all)")
+    parser.add_argument("-i", "--input", type=int, action="append", dest="input_sets",
+                        choices=range(INPUT_SETS), help="input set to run (default: all)")
+    parser.add_argument("-w", "--warmup", type=int, default=1, help="untimed runs before measuring")
+    parser.add_argument("-n", "--iterations", type=int, default=5, help="timed runs per input")
+    parser.add_argument("--dry-run", action="store_true", help="print times without saving")
+    args = parser.parse_args()
+
+    run(args.env, args.puzzles, args.input_sets or list(range(INPUT_SETS)),
+        args.warmup, args.iterations, args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#! /usr/bin/python3
+
+import sys, os, time, json, argparse, subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+from benchmark import ROOT, INPUT_SETS, find_puzzles, get_solution_path, get_input_path, load_times
+
+PUZZLES_FILE = os.path.join(ROOT, "data", "puzzles.json")
+
+Job = Tuple[int, int, int]
+Expected = Dict[str, str]
+
+
+def load_expected() -> Dict[Tuple[int, int], List[Expected]]:
+    with open(PUZZLES_FILE) as file:
+        puzzles = json.load(file)
+    return {
+        (year["year"], day["day"]): day.get("results", [])
+        for year in puzzles["years"]
+        for day in year["days"]
+    }
+
+
+def load_estimates() -> Dict[Tuple[int, int], float]:
+    times = load_times()
+    # Only Python timings say anything about how long these jobs take
+    python_environments = {environment["id"] for environment in times["environments"] if environment["language"] == "py"}
+    estimates: Dict[Tuple[int, int], float] = {}
+    for year in times["years"]:
+        for day in year["days"]:
+            recorded = [entry["time"] for entry in day["times"] if entry["time"] and entry["env"] in python_environments]
+            if recorded:
+                estimates[(year["year"], day["day"])] = max(recorded)
+    return estimates
+
+
+def schedule(jobs: List[Job], estimates: Dict[Tuple[int, int], float]) -> List[Job]:
+    # Longest processing time first; puzzles never timed are assumed slow
+    return sorted(jobs, key=lambda job: -estimates.get(job[:2], float("inf")))
+
+
+def parse_output(output: str) -> Dict[str, str]:
+    results = {}
+    for line in output.splitlines():
+        for part in ("P1", "P2"):
+            if line.startswith(part + ":"):
+                results[part.lower()] = line[len(part) + 1:].strip()
+    return results
+
+
+def run_job(job: Job, timeout: float) -> Tuple[Optional[Dict[str, str]], float, str]:
+    year, day, input_set = job
+    start = time.perf_counter()
+    try:
+        completed = subprocess.run(
+            [sys.executable, get_solution_path(year, day), get_input_path(year, day, input_set)],
+            cwd=os.path.dirname(get_solution_path(year, day)),
+            capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return None, time.perf_counter() - start, "timeout"
+    elapsed = time.perf_counter() - start
+    if completed.returncode:
+        error = completed.stderr.strip().splitlines()
+        return None, elapsed, error[-1] if error else f"exit code {completed.returncode}"
+    return parse_output(completed.stdout), elapsed, ""
+
+
+def check(results: Optional[Dict[str, str]], expected: Expected) -> List[str]:
+    if results is None:
+        return []
+    return [f"{part.upper()} {results.get(part)} != {value}"
+            for part, value in expected.items() if results.get(part) != value]
+
+
+def run(selectors: List[str], input_sets: List[int], workers: int, timeout: float) -> int:
+    expected = load_expected()
+    jobs = [(year, day, input_set)
+            for year, day in find_puzzles(selectors)
+            for input_set in input_sets
+            if input_set < len(expected.get((year, day), []))
+            and os.path.isfile(get_input_path(year, day, input_set))]
+    failures = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_job, job, timeout): job for job in schedule(jobs, load_estimates())}
+        for future in as_completed(futures):
+            year, day, input_set = futures[future]
+            results, elapsed, error = future.result()
+            mismatches = check(results, expected[(year, day)][input_set])
+            if error or mismatches:
+                failures += 1
+                status = "FAIL " + (error or ", ".join(mismatches))
+            else:
+                status = "OK"
+            print(f"{year}/{day:02} input{input_set} {elapsed:.3f}s {status}", flush=True)
+    print()
+    print(f"{len(jobs) - failures}/{len(jobs)} passed in {time.perf_counter() - start:.3f}s")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check Python solutions against the results in data/puzzles.json")
+    parser.add_argument("puzzles", nargs="*", help="YEAR or YEAR/DAY selectors (default: all)")
+    parser.add_argument("-i", "--input", type=int, action="append", dest="input_sets",
+                        choices=range(INPUT_SETS), help="input set to check (default: all)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="concurrent solutions")
+    parser.add_argument("-t", "--timeout", type=float, default=300, help="seconds allowed per solution run")
+    args = parser.parse_args()
+
+    failures = run(args.puzzles, args.input_sets or list(range(INPUT_SETS)), args.jobs, args.timeout)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()